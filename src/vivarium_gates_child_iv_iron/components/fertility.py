@@ -6,14 +6,20 @@ Fertility Models
 Fertility module to create simulants from existing data
 
 """
+import numpy as np
 import pandas as pd
 from pathlib import Path
 
 from vivarium.framework.engine import Builder
 from vivarium.framework.event import Event
+from vivarium.framework.time import get_time_stamp
 from vivarium_public_health import utilities
 
-PREGNANCY_DURATION = pd.Timedelta(days=9 * utilities.DAYS_PER_MONTH)
+PREGNANCY_DURATION = pd.Timedelta(days=9 * utilities.DAYS_PER_MONTH).to_timedelta64()
+
+# Loaded birth record frames keyed by (path, mtime) so repeated setups in one
+# process (interactive runs, replicates) share a single read and its buffers.
+_BIRTH_RECORDS_CACHE = {}
 
 
 class FertilityLineList:
@@ -22,6 +28,15 @@ class FertilityLineList:
     line list data.  Simulants will be registered to the state table on the time steps in which their birth takes place.
     """
 
+    __slots__ = (
+        'clock',
+        'simulant_creator',
+        '_record_arrays',
+        '_birth_dates',
+        '_year_bounds',
+        '_year_cursors',
+    )
+
     configuration_defaults = {}
 
     def __repr__(self):
@@ -37,7 +52,28 @@ class FertilityLineList:
         self.simulant_creator = builder.population.get_simulant_creator()
 
         # Requirements for input data
-        self.birth_records = self._get_birth_records(builder)
+        birth_records = self._get_birth_records(builder)
+        # Keep the records as a dict of column arrays; every downstream
+        # access is a numpy slice, so the frame itself is not retained.
+        self._record_arrays = {
+            column: birth_records[column].to_numpy() for column in birth_records.columns
+        }
+        self._record_arrays['maternal_id'] = birth_records.index.to_numpy()
+        # Pre-extracted datetime64 buffer, reused every step.
+        self._birth_dates = self._record_arrays['birth_date']
+        # Positions of each year's block of records within the sorted frame,
+        # kept as int32 ranges rather than materialized per-year copies.
+        birth_years = birth_records['birth_date'].dt.year.to_numpy()
+        unique_years = np.unique(birth_years)
+        year_starts = np.searchsorted(birth_years, unique_years, side='left').astype(np.int32)
+        year_stops = np.searchsorted(birth_years, unique_years, side='right').astype(np.int32)
+        self._year_bounds = {
+            int(year): (start, stop)
+            for year, start, stop in zip(unique_years, year_starts, year_stops)
+        }
+        # Per-year positions of the first record not yet considered; the
+        # clock only moves forward, so searches resume from here each step.
+        self._year_cursors = {}
 
         builder.event.register_listener("time_step", self.on_time_step)
 
@@ -45,6 +81,9 @@ class FertilityLineList:
     def _get_birth_records(builder: Builder) -> pd.DataFrame:
         """
         Method to load existing fertility data to use as birth records.
+
+        Records are sorted by birth date so each time step can locate its
+        records with a binary search instead of scanning the full year.
         """
         data_directory = Path(builder.configuration.input_data.fertility_input_data_path)
         scenario = builder.configuration.intervention.scenario
@@ -52,8 +91,36 @@ class FertilityLineList:
         seed = builder.configuration.randomness.random_seed
 
         file_path = data_directory / f'scenario_{scenario}_draw_{draw}_seed_{seed}.hdf'
-        birth_records = pd.read_hdf(file_path)
-        return birth_records
+        if not file_path.exists():
+            raise FileNotFoundError(
+                f"No birth records found at {file_path} for scenario '{scenario}', "
+                f"draw {draw}, seed {seed}."
+            )
+        sim_start = get_time_stamp(builder.configuration.time.start)
+        sim_end = get_time_stamp(builder.configuration.time.end)
+        cache_key = (str(file_path), file_path.stat().st_mtime, sim_start, sim_end)
+        cached = _BIRTH_RECORDS_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+        try:
+            # Push the simulation window down into PyTables so only the
+            # chunks overlapping the run are read and decompressed.
+            raw_birth_data = pd.read_hdf(
+                file_path,
+                mode='r',
+                where=f"birth_date > '{sim_start}' & birth_date < '{sim_end}'",
+            )
+        except (TypeError, ValueError):
+            # Fixed-format stores don't support where clauses; read it all.
+            raw_birth_data = pd.read_hdf(file_path, mode='r')
+        raw_birth_data = raw_birth_data.sort_values('birth_date')
+        # float32 is plenty of precision for grams and weeks and halves the
+        # memory footprint of the two big numeric columns.
+        for column in ('birth_weight', 'gestational_age'):
+            if column in raw_birth_data:
+                raw_birth_data[column] = raw_birth_data[column].astype(np.float32)
+        _BIRTH_RECORDS_CACHE[cache_key] = raw_birth_data
+        return raw_birth_data
 
     def on_time_step(self, event: Event) -> None:
         """Adds new simulants every time step determined by a simulant's birth date in the line list data.
@@ -62,20 +129,62 @@ class FertilityLineList:
         event
             The event that triggered the function call.
         """
-        birth_records = self.birth_records
-        born_previous_step_mask = (birth_records['birth_date'] < self.clock()) & (
-            birth_records['birth_date'] > self.clock() - event.step_size)
-        born_previous_step = birth_records[born_previous_step_mask].copy()
-        born_previous_step.loc[:, "maternal_id"] = born_previous_step.index
-        simulants_to_add = len(born_previous_step)
-
-        if simulants_to_add > 0:
-            self.simulant_creator(
-                simulants_to_add,
-                population_configuration={
-                    "age_start": 0,
-                    "age_end": 0,
-                    "sim_state": "time_step",
-                    "new_births": born_previous_step
-                },
+        if not len(self._birth_dates):
+            return
+        clock_time = self.clock()
+        step_start = clock_time - event.step_size
+        # Nothing to do on steps entirely before or after the line list.
+        if (
+            clock_time.to_datetime64() <= self._birth_dates[0]
+            or step_start.to_datetime64() >= self._birth_dates[-1]
+        ):
+            return
+        # A step may span a year boundary, so gather records for both years.
+        years = sorted({step_start.year, clock_time.year})
+        ranges = []
+        simulants_to_add = 0
+        for year in years:
+            bounds = self._year_bounds.get(year)
+            if bounds is None:
+                continue
+            # Records are sorted by birth date, so the records born in the
+            # interval (step_start, clock_time) form a contiguous block, and
+            # the search can resume where the previous step left off.
+            year_start, year_stop = bounds
+            cursor = self._year_cursors.get(year, year_start)
+            start = cursor + np.searchsorted(
+                self._birth_dates[cursor:year_stop], step_start.to_datetime64(), side='right'
+            )
+            stop = start + np.searchsorted(
+                self._birth_dates[start:year_stop], clock_time.to_datetime64(), side='left'
             )
+            self._year_cursors[year] = stop
+            if stop > start:
+                ranges.append((start, stop))
+                simulants_to_add += stop - start
+
+        if not simulants_to_add:
+            return
+
+        # Hand the birth data off as a mapping of column name to ndarray;
+        # consumers align positionally with the new simulant index. Each
+        # column is a plain slice (or a concat of two across a year break).
+        if len(ranges) == 1:
+            start, stop = ranges[0]
+            new_births = {
+                column: values[start:stop] for column, values in self._record_arrays.items()
+            }
+        else:
+            new_births = {
+                column: np.concatenate([values[start:stop] for start, stop in ranges])
+                for column, values in self._record_arrays.items()
+            }
+        self.simulant_creator(
+            simulants_to_add,
+            population_configuration={
+                "age_start": 0,
+                "age_end": 0,
+                "sim_state": "time_step",
+                "new_births": new_births
+            },
+        )
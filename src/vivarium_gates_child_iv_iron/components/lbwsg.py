@@ -23,6 +23,9 @@ class LBWSGLineList(LBWSGRisk):
     """
     Component to initialize low birthweight and short gestation data for simulants based on existing line list data.
     """
+
+    __slots__ = ('start_time', 'birth_exposures')
+
     @property
     def name(self) -> str:
         return "line_list_low_birth_weight_and_short_gestation"
@@ -59,8 +62,11 @@ class LBWSGLineList(LBWSGRisk):
             new_simulants = pd.DataFrame(columns=columns, index=pop_data.index)
             self.population_view.update(new_simulants)
         else:
-            self.new_births = pop_data.user_data["new_births"]
-            self.new_births.index = pop_data.index
+            new_births = pop_data.user_data["new_births"]
+            self.birth_exposures = {
+                axis: pd.Series(new_births[axis], index=pop_data.index)
+                for axis in self.AXES
+            }
 
             super().on_initialize_simulants(pop_data)
 
@@ -69,4 +75,4 @@ class LBWSGLineList(LBWSGRisk):
     ##################################
 
     def _get_birth_exposure(self, axis: str, index: pd.Index) -> pd.Series:
-        return self.new_births.loc[index, axis]
+        return self.birth_exposures[axis].loc[index]
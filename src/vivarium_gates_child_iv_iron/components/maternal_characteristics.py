@@ -7,6 +7,7 @@ import pandas as pd
 from typing import Callable
 
 from vivarium.framework.engine import Builder
+from vivarium.framework.event import Event
 from vivarium.framework.lookup import LookupTable
 from vivarium.framework.population import PopulationView, SimulantData
 from vivarium.framework.time import get_time_stamp
@@ -27,6 +28,12 @@ from vivarium_gates_child_iv_iron.constants.data_keys import (
 from vivarium_gates_child_iv_iron.constants import data_values
 from vivarium_gates_child_iv_iron.utilities import get_random_variable
 
+# Fixed category sets so the exposure columns can be stored as categoricals
+# with stable codes across time steps.
+SUPPLEMENTATION_CATEGORIES = ("uncovered", "ifa", "mms", "bep")
+IV_IRON_CATEGORIES = ("uncovered", "covered")
+BMI_ANEMIA_CATEGORIES = ("cat1", "cat2", "cat3", "cat4")
+
 
 class MaternalCharacteristics:
 
@@ -113,6 +120,11 @@ class MaternalCharacteristics:
 
         self._register_simulant_initializer(builder)
 
+        # The exposure pipelines are typically all pulled for the same index
+        # each time step; share one view fetch between them per step.
+        self._pop_cache = {}
+        builder.event.register_listener("time_step__prepare", self.on_time_step_prepare)
+
     def _register_simulant_initializer(self, builder: Builder) -> None:
         builder.population.initializes_simulants(
             self.on_initialize_simulants,
@@ -123,32 +135,56 @@ class MaternalCharacteristics:
             ],
         )
 
+    def on_time_step_prepare(self, event: Event) -> None:
+        self._pop_cache = {}
+
     def on_initialize_simulants(self, pop_data: SimulantData) -> None:
         """
         Initialize simulants from line list data. Population configuration
         contains a key "new_births" which is the line list data.
         """
-        columns = [
-            self.supplementation_exposure_column_name,
-            self.iv_iron_exposure_column_name,
-            self.maternal_bmi_anemia_exposure_column_name,
-        ]
-        new_simulants = pd.DataFrame(columns=columns, index=pop_data.index)
-
         if pop_data.creation_time >= self.start_time:
             new_births = pop_data.user_data["new_births"]
-            new_births.index = pop_data.index
 
             maternal_supplementation = new_births['maternal_supplementation_coverage'].copy()
             maternal_supplementation[maternal_supplementation == 'invalid'] = 'uncovered'
-            new_simulants[self.supplementation_exposure_column_name] = maternal_supplementation
 
             iv_iron_exposure = new_births['maternal_antenatal_iv_iron_coverage'].copy()
             iv_iron_exposure[iv_iron_exposure == "invalid"] = "uncovered"
-            new_simulants[self.iv_iron_exposure_column_name] = iv_iron_exposure
 
-            new_simulants[self.maternal_bmi_anemia_exposure_column_name] = (
-                new_births['joint_bmi_anemia_category']
+            new_simulants = pd.DataFrame(
+                {
+                    self.supplementation_exposure_column_name: pd.Categorical(
+                        maternal_supplementation, categories=SUPPLEMENTATION_CATEGORIES
+                    ),
+                    self.iv_iron_exposure_column_name: pd.Categorical(
+                        iv_iron_exposure, categories=IV_IRON_CATEGORIES
+                    ),
+                    self.maternal_bmi_anemia_exposure_column_name: pd.Categorical(
+                        new_births['joint_bmi_anemia_category'],
+                        categories=BMI_ANEMIA_CATEGORIES,
+                    ),
+                },
+                index=pop_data.index,
+            )
+        else:
+            # The initial population has no exposure data; the columns still
+            # need the categorical dtypes of the birth branch so state-table
+            # and update dtypes agree. Code -1 is the categorical NaN.
+            missing = np.full(len(pop_data.index), -1, dtype=np.int8)
+            new_simulants = pd.DataFrame(
+                {
+                    self.supplementation_exposure_column_name: pd.Categorical.from_codes(
+                        missing, categories=SUPPLEMENTATION_CATEGORIES
+                    ),
+                    self.iv_iron_exposure_column_name: pd.Categorical.from_codes(
+                        missing, categories=IV_IRON_CATEGORIES
+                    ),
+                    self.maternal_bmi_anemia_exposure_column_name: pd.Categorical.from_codes(
+                        missing, categories=BMI_ANEMIA_CATEGORIES
+                    ),
+                },
+                index=pop_data.index,
             )
 
         self.population_view.update(new_simulants)
@@ -165,40 +201,62 @@ class MaternalCharacteristics:
     ##################################
     # Pipeline sources and modifiers #
     ##################################
-    def _get_bep_exposure(self, index: pd.Index) -> pd.Series:
-        pop = self.population_view.get(index)
-        has_bep = pop[self.supplementation_exposure_column_name] == "bep"
 
-        exposure = pd.Series(BEP_SUPPLEMENTATION.CAT1, index=index)
-        exposure[has_bep] = BEP_SUPPLEMENTATION.CAT2
-        return exposure
+    def _get_pop(self, index: pd.Index) -> pd.DataFrame:
+        # Keyed by index identity; holding the index in the cache entry keeps
+        # the key valid for the lifetime of the cache (cleared each step).
+        key = id(index)
+        cached = self._pop_cache.get(key)
+        if cached is None:
+            cached = (index, self.population_view.get(index))
+            self._pop_cache[key] = cached
+        return cached[1]
 
-    def _get_ifa_exposure(self, index: pd.Index) -> pd.Series:
-        pop = self.population_view.get(index)
-        has_ifa = pop[self.supplementation_exposure_column_name].isin(["ifa", "mms", "bep"])
+    def _get_bep_exposure(self, index: pd.Index) -> pd.Series:
+        pop = self._get_pop(index)
+        has_bep = (pop[self.supplementation_exposure_column_name] == "bep").to_numpy()
+        return pd.Series(
+            np.where(has_bep, BEP_SUPPLEMENTATION.CAT2, BEP_SUPPLEMENTATION.CAT1),
+            index=index,
+        )
 
-        exposure = pd.Series(IFA_SUPPLEMENTATION.CAT1, index=index)
-        exposure[has_ifa] = IFA_SUPPLEMENTATION.CAT2
-        return exposure
+    def _get_ifa_exposure(self, index: pd.Index) -> pd.Series:
+        pop = self._get_pop(index)
+        has_ifa = (
+            pop[self.supplementation_exposure_column_name]
+            .isin(["ifa", "mms", "bep"])
+            .to_numpy()
+        )
+        return pd.Series(
+            np.where(has_ifa, IFA_SUPPLEMENTATION.CAT2, IFA_SUPPLEMENTATION.CAT1),
+            index=index,
+        )
 
     def _get_mmn_exposure(self, index: pd.Index) -> pd.Series:
-        pop = self.population_view.get(index)
-        has_mmn = pop[self.supplementation_exposure_column_name].isin(["mms", "bep"])
-
-        exposure = pd.Series(MMN_SUPPLEMENTATION.CAT1, index=index)
-        exposure[has_mmn] = MMN_SUPPLEMENTATION.CAT2
-        return exposure
+        pop = self._get_pop(index)
+        has_mmn = (
+            pop[self.supplementation_exposure_column_name].isin(["mms", "bep"]).to_numpy()
+        )
+        return pd.Series(
+            np.where(has_mmn, MMN_SUPPLEMENTATION.CAT2, MMN_SUPPLEMENTATION.CAT1),
+            index=index,
+        )
 
     def _get_iv_iron_exposure(self, index: pd.Index) -> pd.Series:
-        pop = self.population_view.get(index)
-        exposure = pd.Series("cat1", index=index, name=self.iv_iron_exposure_pipeline_name)
-        exposure[pop[self.iv_iron_exposure_column_name] == "covered"] = "cat2"
-        return exposure
+        pop = self._get_pop(index)
+        covered = (pop[self.iv_iron_exposure_column_name] == "covered").to_numpy()
+        return pd.Series(
+            np.where(covered, "cat2", "cat1"),
+            index=index,
+            name=self.iv_iron_exposure_pipeline_name,
+        )
 
     def _get_maternal_bmi_anemia_exposure(self, index: pd.Index) -> pd.Series:
-        exposure = self.population_view.get(index)[self.maternal_bmi_anemia_exposure_column_name]
-        exposure.name = self.maternal_bmi_anemia_exposure_pipeline_name
-        return exposure
+        # rename rather than mutating .name in place so the cached frame's
+        # column is left untouched.
+        return self._get_pop(index)[self.maternal_bmi_anemia_exposure_column_name].rename(
+            self.maternal_bmi_anemia_exposure_pipeline_name
+        )
 
 
 class AdditiveRiskEffect(RiskEffect):
@@ -213,6 +271,9 @@ class AdditiveRiskEffect(RiskEffect):
         self.effect = self._get_effect_pipeline(builder)
         self.excess_shift_source = self._get_excess_shift_source(builder)
         self.risk_specific_shift_source = self._get_risk_specific_shift_source(builder)
+        # Categorical dtype over the excess shift columns, built on first use;
+        # lets get_effect encode exposures without re-deriving the categories.
+        self._excess_shift_dtype = None
 
     # NOTE: this RR will never be used. Overriding superclass to avoid error
     def _get_relative_risk_source(self, builder: Builder) -> LookupTable:
@@ -272,18 +333,25 @@ class AdditiveRiskEffect(RiskEffect):
         return target + self.risk_specific_shift_source(index)
 
     def get_effect(self, index: pd.Index) -> pd.Series:
-        index_columns = ['index', self.risk.name]
-
         excess_shift = self.excess_shift_source(index)
-        exposure = self.exposure(index).reset_index()
-        exposure.columns = index_columns
-        exposure = exposure.set_index(index_columns)
-
-        relative_risk = excess_shift.stack().reset_index()
-        relative_risk.columns = index_columns + ['value']
-        relative_risk = relative_risk.set_index(index_columns)
-
-        raw_effect = relative_risk.loc[exposure.index, 'value'].droplevel(self.risk.name)
+        exposure = self.exposure(index)
+
+        # Gather each simulant's shift from the column matching their exposure
+        # category, rather than stacking the wide lookup result to long form
+        # and merging on a two-level index.
+        if self._excess_shift_dtype is None:
+            self._excess_shift_dtype = pd.CategoricalDtype(excess_shift.columns)
+        codes = exposure.astype(self._excess_shift_dtype).cat.codes.to_numpy()
+        if (codes < 0).any():
+            unknown = set(exposure[codes < 0].unique())
+            raise ValueError(
+                f"Exposure values {unknown} for {self.risk} have no column in "
+                f"the excess shift data {list(excess_shift.columns)}."
+            )
+        raw_effect = pd.Series(
+            excess_shift.to_numpy()[np.arange(len(codes)), codes],
+            index=index,
+        )
 
         risk_specific_shift = self.risk_specific_shift_source(index)
         effect = raw_effect - risk_specific_shift
@@ -349,6 +417,20 @@ class BirthWeightShiftEffect:
             requires_values=list(self.pipelines.keys()),
         )
 
+        # Both the stunting and wasting modifiers need the total shift for
+        # the same index each time step; cache it for the duration of a step.
+        self._cached_index = None
+        self._cached_total_shift = None
+        builder.event.register_listener("time_step__prepare", self.on_time_step_prepare)
+
+    ########################
+    # Event-driven methods #
+    ########################
+
+    def on_time_step_prepare(self, event: Event) -> None:
+        self._cached_index = None
+        self._cached_total_shift = None
+
     ##################################
     # Pipeline sources and modifiers #
     ##################################
@@ -370,10 +452,18 @@ class BirthWeightShiftEffect:
     ##################
 
     def _get_total_birth_weight_shift(self, index: pd.Index) -> pd.Series:
-        return (
-            pd.concat([pipeline(index) for pipeline in self.pipelines.values()], axis=1)
-            .sum(axis=1)
-        )
+        if self._cached_index is not None and index.equals(self._cached_index):
+            return self._cached_total_shift
+        # float32 carries plenty of precision for shifts measured in grams
+        # and halves the bandwidth of this per-step accumulation.
+        pipelines = iter(self.pipelines.values())
+        total = next(pipelines)(index).to_numpy(np.float32, copy=True)
+        for pipeline in pipelines:
+            total += pipeline(index).to_numpy(np.float32)
+        total_shift = pd.Series(total, index=index)
+        self._cached_index = index
+        self._cached_total_shift = total_shift
+        return total_shift
 
     # noinspection PyMethodMayBeStatic
     def _get_stunting_effect_per_gram(self, builder: Builder) -> pd.Series:
@@ -384,16 +474,22 @@ class BirthWeightShiftEffect:
 
     @staticmethod
     def _apply_birth_weight_effect(target: pd.DataFrame, cat3_increase: pd.Series) -> pd.DataFrame:
-        sam_and_mam = target["cat1"] + target["cat2"]
-        cat3 = target["cat3"]
+        # Work in float32: the exposure parameters are probabilities and the
+        # shifts are small, so single precision is ample for the arithmetic.
+        cat1 = target["cat1"].to_numpy(np.float32)
+        cat2 = target["cat2"].to_numpy(np.float32)
+        cat3 = target["cat3"].to_numpy(np.float32)
+        increase = np.asarray(cat3_increase, dtype=np.float32)
+        sam_and_mam = cat1 + cat2
 
         # can't remove more from a category than exists in it categories
         true_cat3_increase = np.maximum(
-            np.minimum(sam_and_mam, cat3_increase),
-            np.minimum(cat3, -cat3_increase)
+            np.minimum(sam_and_mam, increase),
+            np.minimum(cat3, -increase)
         )
+        scale = 1 - true_cat3_increase / sam_and_mam
 
-        target["cat3"] = target["cat3"] + true_cat3_increase
-        target["cat2"] = target["cat2"] * (1 - true_cat3_increase / sam_and_mam)
-        target["cat1"] = target["cat1"] * (1 - true_cat3_increase / sam_and_mam)
+        target["cat3"] = cat3 + true_cat3_increase
+        target["cat2"] = cat2 * scale
+        target["cat1"] = cat1 * scale
         return target
@@ -1,4 +1,4 @@
-from collections import Counter
+import numpy as np
 import pandas as pd
 from typing import Dict
 
@@ -11,10 +11,25 @@ from vivarium_public_health.metrics.stratification import (
     ResultsStratifier as ResultsStratifier_,
     Source,
     SourceType,
+    StratificationLevel,
 )
 
 from vivarium_gates_child_iv_iron.constants import data_keys
 
+# Shared by the wasting and stunting stratifications; built once at import.
+# Module level because class-body comprehensions cannot see class attributes.
+CGF_CATEGORIES = frozenset(category.value for category in data_keys.CGFCategories)
+_CGF_CATEGORY_MAP = {
+    "cat4": data_keys.CGFCategories.UNEXPOSED.value,
+    "cat3": data_keys.CGFCategories.MILD.value,
+    "cat2": data_keys.CGFCategories.MODERATE.value,
+    "cat1": data_keys.CGFCategories.SEVERE.value,
+}
+_CGF_SOURCE_CATEGORIES = ("cat1", "cat2", "cat3", "cat4")
+_CGF_CATEGORY_LUT = np.array(
+    [_CGF_CATEGORY_MAP[category] for category in _CGF_SOURCE_CATEGORIES], dtype=object
+)
+
 
 class ResultsStratifier(ResultsStratifier_):
     """Centralized component for handling results stratification.
@@ -24,6 +39,12 @@ class ResultsStratifier(ResultsStratifier_):
     final column labels for the subgroups.
     """
 
+    # noinspection PyAttributeOutsideInit
+    def setup(self, builder: Builder) -> None:
+        super().setup(builder)
+        self._current_stratifications_cache = {}
+        self._group_cache = {}
+
     def register_stratifications(self, builder: Builder) -> None:
         """Register each desired stratification with calls to _setup_stratification"""
         super().register_stratifications(builder)
@@ -32,7 +53,7 @@ class ResultsStratifier(ResultsStratifier_):
             builder,
             name="wasting_state",
             sources=[Source(f'{data_keys.WASTING.name}.exposure', SourceType.PIPELINE)],
-            categories={category.value for category in data_keys.CGFCategories},
+            categories=CGF_CATEGORIES,
             mapper=self.child_growth_risk_factor_stratification_mapper,
         )
 
@@ -40,7 +61,7 @@ class ResultsStratifier(ResultsStratifier_):
             builder,
             name="stunting_state",
             sources=[Source(f'{data_keys.STUNTING.name}.exposure', SourceType.PIPELINE)],
-            categories={category.value for category in data_keys.CGFCategories},
+            categories=CGF_CATEGORIES,
             mapper=self.child_growth_risk_factor_stratification_mapper,
         )
 
@@ -65,19 +86,182 @@ class ResultsStratifier(ResultsStratifier_):
             categories={"cat4", "cat3", "cat2", "cat1"},
         )
 
+    ########################
+    # Event-driven methods #
+    ########################
+
+    def on_time_step_prepare(self, event: Event) -> None:
+        super().on_time_step_prepare(event)
+        # noinspection PyAttributeOutsideInit
+        self._group_cache = {}
+
+    ##################
+    # Public methods #
+    ##################
+
+    def group(self, index, include, exclude):
+        """Takes a full population index and yields stratified subgroups.
+
+        Override of the base implementation that computes each per-level
+        category mask once and reuses it across all stratification
+        combinations, and caches the resulting (label, mask) pairs for the
+        duration of the time step so observers sharing an index and
+        stratification request share one pass.
+        """
+        cache_key = (id(index), frozenset(include), frozenset(exclude))
+        cached = self._group_cache.get(cache_key)
+        if cached is None:
+            # Hold the index in the cache entry so its id stays valid for the
+            # lifetime of the cache (cleared each step).
+            cached = (index, list(self._stratified_groups(index, include, exclude)))
+            self._group_cache[cache_key] = cached
+        return iter(cached[1])
+
+    def _stratified_groups(self, index, include, exclude):
+        stratification_groups = self.stratification_groups.loc[index]
+        level_masks = {}
+
+        for stratification, stratification_key in self._get_current_stratifications_with_keys(
+            include, exclude
+        ):
+            mask = None
+            if not index.empty:
+                for level, category in stratification:
+                    level_mask = level_masks.get((level.name, category))
+                    if level_mask is None:
+                        level_mask = (
+                            stratification_groups[level.name] == category
+                        ).to_numpy()
+                        level_masks[(level.name, category)] = level_mask
+                    mask = level_mask if mask is None else mask & level_mask
+
+            if mask is None:
+                group_mask = pd.Series(True, index=index)
+            else:
+                group_mask = pd.Series(mask, index=index)
+            yield stratification_key, group_mask
+
+    ##################
+    # Helper methods #
+    ##################
+
+    def _get_current_stratifications_with_keys(self, include, exclude):
+        # The stratification product only changes when the set of requested
+        # levels or the year's current categories change, so it can be built
+        # once per (include, exclude, year) rather than on every group() call.
+        # The string keys are cached alongside so the join/lower formatting
+        # work also happens once per cache entry rather than per yield.
+        cache_key = (frozenset(include), frozenset(exclude), self.clock().year)
+        stratifications = self._current_stratifications_cache.get(cache_key)
+        if stratifications is None:
+            stratifications = [
+                (stratification, self._get_stratification_key(stratification))
+                for stratification in self._get_current_stratifications(include, exclude)
+            ]
+            self._current_stratifications_cache[cache_key] = stratifications
+        return stratifications
+
+    # Levels whose category is just the string value of their single source.
+    IDENTITY_LEVELS = frozenset({"sex", "maternal_supplementation", "iv_iron", "bmi_anemia"})
+
+    # Child growth failure levels share the same exposure-category renaming.
+    CGF_LEVELS = frozenset({"wasting_state", "stunting_state"})
+    CGF_CATEGORY_MAP = _CGF_CATEGORY_MAP
+    CGF_SOURCE_CATEGORIES = _CGF_SOURCE_CATEGORIES
+    # Lookup table aligned with CGF_SOURCE_CATEGORIES codes for an
+    # interpreter-free translation of the whole exposure column.
+    CGF_CATEGORY_LUT = _CGF_CATEGORY_LUT
+
+    def _set_stratification_groups(self, index: pd.Index) -> pd.DataFrame:
+        """Determine each simulant's category for each stratification level.
+
+        Vectorized override of the base implementation: levels whose
+        categories can be derived with a column-level operation skip the
+        row-wise mapper entirely.
+        """
+        pop = self.population_view.get(index, query='tracked == True and alive == "alive"')
+        # The view returns a fresh frame, so pipeline values can be assigned
+        # straight into it; they are produced for pop.index, making a Series
+        # re-wrap and an aligning concat unnecessary.
+        for name, pipeline in self.pipelines.items():
+            pop[name] = pipeline(pop.index).to_numpy()
+        sources = pop
+
+        # Store each level as a categorical so downstream equality checks in
+        # group() compare int8 codes rather than Python strings.
+        stratification_groups = {
+            level.name: pd.Categorical(
+                self._get_level_categories(level, sources, pop.index),
+                categories=sorted(level.categories),
+            )
+            for level in self.stratification_levels.values()
+        }
+        return pd.DataFrame(stratification_groups, index=pop.index)
+
+    def _get_level_categories(
+        self, level: StratificationLevel, sources: pd.DataFrame, index: pd.Index
+    ) -> pd.Series:
+        source_names = [source.name for source in level.sources]
+
+        if all(source.type == SourceType.CLOCK for source in level.sources):
+            # Clock sources have one value per time step; map it once and
+            # broadcast the resulting category.
+            row = pd.Series([self.clock()] * len(source_names), index=source_names)
+            return pd.Series(level.mapper(row).iat[0], index=index)
+
+        if level.name == ResultsStratifier_.AGE:
+            bin_edges = np.append(
+                self.age_bins["age_start"].to_numpy(),
+                self.age_bins["age_end"].to_numpy()[-1:],
+            )
+            return pd.cut(
+                sources[source_names[0]],
+                bins=bin_edges,
+                labels=list(self.age_bins["age_group_name"]),
+                right=False,
+            ).astype(str)
+
+        if level.name in self.IDENTITY_LEVELS:
+            values = sources[source_names[0]].astype(str)
+            # The wrapped per-row mapper validated its output; keep that
+            # contract so out-of-category values (e.g. 'nan' from a missing
+            # source) raise instead of silently matching no stratum.
+            invalid_mask = ~values.isin(level.categories)
+            if invalid_mask.any():
+                invalid = set(values[invalid_mask].unique())
+                raise ValueError(f"Invalid values {invalid} found in {level.name}.")
+            return values
+
+        if level.name in self.CGF_LEVELS:
+            # Translate cat1-cat4 to category names through int8 codes and a
+            # numpy take rather than a per-element hash lookup.
+            values = sources[source_names[0]]
+            codes = pd.Categorical(
+                values, categories=self.CGF_SOURCE_CATEGORIES
+            ).codes
+            if (codes < 0).any():
+                # Code -1 would wrap around to the last LUT entry; keep the
+                # wrapped mapper's fail-loud contract instead.
+                invalid = set(values[codes < 0].unique())
+                raise ValueError(f"Invalid values {invalid} found in {level.name}.")
+            return pd.Series(self.CGF_CATEGORY_LUT[codes], index=index)
+
+        # Levels with bespoke mappers fall back to the row-wise path.
+        return (
+            sources[source_names]
+            .apply(level.mapper, axis=1)
+            .squeeze(axis=1)
+            .rename(level.name)
+        )
+
     ###########################
     # Stratifications Details #
     ###########################
 
     # noinspection PyMethodMayBeStatic
     def child_growth_risk_factor_stratification_mapper(self, row: pd.Series) -> str:
-        # applicable to stunting and wasting
-        return {
-            "cat4": data_keys.CGFCategories.UNEXPOSED.value,
-            "cat3": data_keys.CGFCategories.MILD.value,
-            "cat2": data_keys.CGFCategories.MODERATE.value,
-            "cat1": data_keys.CGFCategories.SEVERE.value,
-        }[row.squeeze()]
+        # applicable to stunting and wasting; rows always have one column
+        return self.CGF_CATEGORY_MAP[row.iat[0]]
 
 
 class DisabilityObserver(DisabilityObserver_):
@@ -127,7 +311,9 @@ class BirthObserver:
         self.stratifier = self._get_stratifier(builder)
         self.population_view = self._get_population_view(builder)
 
-        self.counts = Counter()
+        # One 4-vector of running sums per stratum label; the metric name
+        # strings are only built once, when metrics are collected.
+        self.counts = {}
 
         self._register_collect_metrics_listener(builder)
         self._register_metrics_modifier(builder)
@@ -159,30 +345,62 @@ class BirthObserver:
 
     def on_collect_metrics(self, event: Event) -> None:
         pop = self.population_view.get(event.index)
-        pop_born = pop[pop['entrance_time'] == event.time - event.step_size]
 
-        if pop_born.empty:
+        # Pull the raw column buffers once and do the cohort selection in
+        # numpy; the full born sub-frame is never materialized.
+        entrance_times = pop["entrance_time"].to_numpy()
+        born_mask = entrance_times == (event.time - event.step_size).to_datetime64()
+        if not born_mask.any():
             return
+        born_index = pop.index[born_mask]
+        birth_weights = pop[self.birth_weight_column_name].to_numpy()[born_mask]
+        gestational_ages = pop[self.gestational_age_column_name].to_numpy()[born_mask]
+        low_birth_weights = birth_weights < self.low_birth_weight_limit
+
         groups = self.stratifier.group(
-            pop_born.index, self.config.include, self.config.exclude
+            born_index, self.config.include, self.config.exclude
         )
-        for label, group_mask in groups:
-            pop_born_in_group = pop_born[group_mask]
-            low_birth_weight_mask = pop_born_in_group[self.birth_weight_column_name] < self.low_birth_weight_limit
-            new_observations = {
-                f"live_births_{label}": pop_born_in_group.index.size,
-                f"birth_weight_sum_{label}": pop_born_in_group[self.birth_weight_column_name].sum(),
-                f"gestational_age_sum_{label}":
-                    pop_born_in_group[self.gestational_age_column_name].sum(),
-                f'low_weight_births_{label}': low_birth_weight_mask.sum()
-            }
-            self.counts.update(new_observations)
+
+        # The strata partition the born cohort, so collapse the group masks
+        # to one integer label per simulant and aggregate every measure with
+        # single-pass bincounts instead of four masked reductions per group.
+        labels = []
+        label_codes = np.full(len(born_index), -1, dtype=np.intp)
+        for code, (label, group_mask) in enumerate(groups):
+            labels.append(label)
+            label_codes[group_mask.to_numpy()] = code
+
+        num_groups = len(labels)
+        grouped = label_codes >= 0
+        codes = label_codes[grouped]
+        step_counts = np.stack(
+            [
+                np.bincount(codes, minlength=num_groups),
+                np.bincount(codes, weights=birth_weights[grouped], minlength=num_groups),
+                np.bincount(
+                    codes, weights=gestational_ages[grouped], minlength=num_groups
+                ),
+                np.bincount(
+                    codes, weights=low_birth_weights[grouped], minlength=num_groups
+                ),
+            ]
+        )
+
+        for code, label in enumerate(labels):
+            accumulator = self.counts.get(label)
+            if accumulator is None:
+                accumulator = self.counts[label] = np.zeros(4)
+            accumulator += step_counts[:, code]
 
     ##################################
     # Pipeline sources and modifiers #
     ##################################
 
     def metrics(self, index: pd.Index, metrics: Dict) -> Dict:
-        metrics.update(self.counts)
+        for label, values in self.counts.items():
+            metrics[f"live_births_{label}"] = int(values[0])
+            metrics[f"birth_weight_sum_{label}"] = values[1]
+            metrics[f"gestational_age_sum_{label}"] = values[2]
+            metrics[f"low_weight_births_{label}"] = int(values[3])
 
         return metrics
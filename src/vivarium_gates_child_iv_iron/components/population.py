@@ -8,6 +8,7 @@ This module contains a component for creating a base population from line list d
 """
 import glob
 
+import numpy as np
 import pandas as pd
 from vivarium.framework.engine import Builder
 from vivarium.framework.population import SimulantData
@@ -86,29 +87,56 @@ class PopulationLineList(BasePopulation):
         Creates simulants based on their birth date from the line list data.  Their demographic characteristics are also
         determined by the input data.
         """
-        columns = [
-            "age",
-            "sex",
-            "alive",
-            "location",
-            "entrance_time",
-            "exit_time",
-            "maternal_id",
-        ]
-        new_simulants = pd.DataFrame(columns=columns, index=pop_data.index)
-
         if pop_data.creation_time >= self.start_time:
             new_births = pop_data.user_data["new_births"]
-            new_births.index = pop_data.index
-
-            # Create columns for state table
-            new_simulants["age"] = 0.0
-            new_simulants["sex"] = new_births["sex"]
-            new_simulants["alive"] = "alive"
-            new_simulants["location"] = self.location
-            new_simulants["entrance_time"] = pop_data.creation_time
-            new_simulants["exit_time"] = pd.NaT
-            new_simulants["maternal_id"] = new_births["maternal_id"]
+
+            # Build each state table column as its own pre-typed contiguous
+            # 1D buffer rather than assigning into an object-typed empty
+            # frame, which would retype and copy every column.
+            num_births = len(pop_data.index)
+            new_simulants = pd.DataFrame(
+                {
+                    "age": np.zeros(num_births),
+                    "sex": new_births["sex"],
+                    # One-byte codes instead of N python string pointers, and
+                    # downstream == "alive" checks compare codes.
+                    "alive": pd.Categorical.from_codes(
+                        np.zeros(num_births, dtype=np.int8),
+                        categories=["alive", "dead", "untracked"],
+                    ),
+                    "location": pd.Categorical.from_codes(
+                        np.zeros(num_births, dtype=np.int8),
+                        categories=[self.location],
+                    ),
+                    "entrance_time": np.full(
+                        num_births,
+                        np.datetime64(pop_data.creation_time),
+                        dtype="datetime64[ns]",
+                    ),
+                    "exit_time": np.full(
+                        num_births, np.datetime64("NaT"), dtype="datetime64[ns]"
+                    ),
+                    "maternal_id": new_births["maternal_id"],
+                },
+                index=pop_data.index,
+            )
+        else:
+            new_simulants = pd.DataFrame(
+                {
+                    "age": pd.Series(dtype=float),
+                    "sex": pd.Series(dtype=object),
+                    "alive": pd.Series(
+                        pd.Categorical([], categories=["alive", "dead", "untracked"])
+                    ),
+                    "location": pd.Series(
+                        pd.Categorical([], categories=[self.location])
+                    ),
+                    "entrance_time": pd.Series(dtype="datetime64[ns]"),
+                    "exit_time": pd.Series(dtype="datetime64[ns]"),
+                    "maternal_id": pd.Series(dtype=float),
+                },
+                index=pop_data.index,
+            )
 
         self.register_simulants(new_simulants[self.key_columns])
         self.population_view.update(new_simulants)
@@ -1,9 +1,5 @@
 from typing import Dict, NamedTuple, Tuple
 
-from scipy import stats
-
-from vivarium_gates_child_iv_iron.utilities import get_norm_from_quantiles
-
 
 ##########################
 # Cause Model Parameters #
@@ -12,80 +8,118 @@ from vivarium_gates_child_iv_iron.utilities import get_norm_from_quantiles
 # diarrhea and lower respiratory infection birth prevalence
 BIRTH_PREVALENCE_OF_ZERO = 0
 
-# diarrhea duration in days
-DIARRHEA_DURATION: Tuple = (
-    'diarrheal_diseases_duration', get_norm_from_quantiles(mean=4.3, lower=4.3, upper=4.3)
-)
-
 # measles duration in days
 MEASLES_DURATION: int = 10
 
-# LRI duration in days
-LRI_DURATION: Tuple = (
-    'lri_duration', get_norm_from_quantiles(mean=7.79, lower=6.2, upper=9.64)
-)
-
-
 # duration > bin_duration, so there is effectively no remission,
 # and duration within the bin is bin_duration / 2
 EARLY_NEONATAL_CAUSE_DURATION: float = 3.5
 
 
+# The distribution-valued constants below pull in scipy and build frozen
+# distributions, so they are materialized lazily (PEP 562) on first access
+# rather than at import time; CLI entry points that never touch them skip
+# the cost entirely.
+
+def _make_diarrhea_duration() -> Tuple:
+    # diarrhea duration in days
+    from vivarium_gates_child_iv_iron.utilities import get_norm_from_quantiles
+    return (
+        'diarrheal_diseases_duration', get_norm_from_quantiles(mean=4.3, lower=4.3, upper=4.3)
+    )
+
+
+def _make_lri_duration() -> Tuple:
+    # LRI duration in days
+    from vivarium_gates_child_iv_iron.utilities import get_norm_from_quantiles
+    return (
+        'lri_duration', get_norm_from_quantiles(mean=7.79, lower=6.2, upper=9.64)
+    )
+
+
 ##########################
 # LBWSG Model Parameters #
 ##########################
-class __LBWSG(NamedTuple):
 
-    STUNTING_EFFECT_PER_GRAM: Tuple[str, stats.norm] = (
-        'stunting_effect_per_gram', stats.norm(loc=1e-04, scale=3e-05)
-    )
-    WASTING_EFFECT_PER_GRAM: float = 5.75e-05
+def _make_lbwsg() -> NamedTuple:
+    from scipy import stats
 
+    class __LBWSG(NamedTuple):
 
-LBWSG = __LBWSG()
+        STUNTING_EFFECT_PER_GRAM: Tuple[str, stats.norm] = (
+            'stunting_effect_per_gram', stats.norm(loc=1e-04, scale=3e-05)
+        )
+        WASTING_EFFECT_PER_GRAM: float = 5.75e-05
 
+    return __LBWSG()
 
-class __MaternalCharacteristics(NamedTuple):
 
-    DISTRIBUTION: str = 'dichotomous'
-    CATEGORIES: Dict[str, str] = {
-        'cat1': 'uncovered',
-        'cat2': 'covered',
-    }
+def _make_maternal_characteristics() -> NamedTuple:
+    from scipy import stats
 
-    IFA_BIRTH_WEIGHT_SHIFT: Tuple[str, stats.norm] = (
-        'ifa_birth_weight_shift', get_norm_from_quantiles(mean=57.73, lower=7.66, upper=107.79)
-    )
+    from vivarium_gates_child_iv_iron.utilities import get_norm_from_quantiles
 
-    BASELINE_MMN_COVERAGE: float = 0.0
-    MMN_BIRTH_WEIGHT_SHIFT: Tuple[str, stats.norm] = (
-        'mmn_birth_weight_shift', get_norm_from_quantiles(mean=45.16, lower=32.31, upper=58.02)
-    )
+    class __MaternalCharacteristics(NamedTuple):
 
-    BASELINE_BEP_COVERAGE: float = 0.0
-    BEP_BIRTH_WEIGHT_SHIFT: Tuple[str, stats.norm] = (
-        'bep_birth_weight_shift', get_norm_from_quantiles(mean=66.96, lower=13.13, upper=120.78)
-    )
+        DISTRIBUTION: str = 'dichotomous'
+        CATEGORIES: Dict[str, str] = {
+            'cat1': 'uncovered',
+            'cat2': 'covered',
+        }
 
-    BASELINE_IV_IRON_COVERAGE: float = 0.0
-    IV_IRON_BIRTH_WEIGHT_SHIFT: Tuple[str, stats.norm] = (
-        'iv_iron_birth_weight_shift', get_norm_from_quantiles(mean=50.0, lower=50.0, upper=50.0)
-    )
+        IFA_BIRTH_WEIGHT_SHIFT: Tuple[str, stats.norm] = (
+            'ifa_birth_weight_shift', get_norm_from_quantiles(mean=57.73, lower=7.66, upper=107.79)
+        )
 
-    BMI_ANEMIA_CAT3_BIRTH_WEIGHT_SHIFT: Tuple[str, stats.norm] = (
-        'bmi_anemia_cat3_birth_weight_shift',
-        get_norm_from_quantiles(mean=-182.0, lower=-239.0, upper=-125.0)
-    )
+        BASELINE_MMN_COVERAGE: float = 0.0
+        MMN_BIRTH_WEIGHT_SHIFT: Tuple[str, stats.norm] = (
+            'mmn_birth_weight_shift', get_norm_from_quantiles(mean=45.16, lower=32.31, upper=58.02)
+        )
 
-    BMI_ANEMIA_CAT2_BIRTH_WEIGHT_SHIFT: Tuple[str, stats.norm] = (
-        'bmi_anemia_cat2_birth_weight_shift',
-        get_norm_from_quantiles(mean=-94.0, lower=-142.0, upper=-46.0)
-    )
+        BASELINE_BEP_COVERAGE: float = 0.0
+        BEP_BIRTH_WEIGHT_SHIFT: Tuple[str, stats.norm] = (
+            'bep_birth_weight_shift', get_norm_from_quantiles(mean=66.96, lower=13.13, upper=120.78)
+        )
 
-    BMI_ANEMIA_CAT1_BIRTH_WEIGHT_SHIFT: Tuple[str, stats.norm] = (
-        'bmi_anemia_cat1_birth_weight_shift',
-        get_norm_from_quantiles(mean=-275.0, lower=-336.0, upper=-213.0)
-    )
+        BASELINE_IV_IRON_COVERAGE: float = 0.0
+        IV_IRON_BIRTH_WEIGHT_SHIFT: Tuple[str, stats.norm] = (
+            'iv_iron_birth_weight_shift', get_norm_from_quantiles(mean=50.0, lower=50.0, upper=50.0)
+        )
+
+        BMI_ANEMIA_CAT3_BIRTH_WEIGHT_SHIFT: Tuple[str, stats.norm] = (
+            'bmi_anemia_cat3_birth_weight_shift',
+            get_norm_from_quantiles(mean=-182.0, lower=-239.0, upper=-125.0)
+        )
+
+        BMI_ANEMIA_CAT2_BIRTH_WEIGHT_SHIFT: Tuple[str, stats.norm] = (
+            'bmi_anemia_cat2_birth_weight_shift',
+            get_norm_from_quantiles(mean=-94.0, lower=-142.0, upper=-46.0)
+        )
+
+        BMI_ANEMIA_CAT1_BIRTH_WEIGHT_SHIFT: Tuple[str, stats.norm] = (
+            'bmi_anemia_cat1_birth_weight_shift',
+            get_norm_from_quantiles(mean=-275.0, lower=-336.0, upper=-213.0)
+        )
+
+    return __MaternalCharacteristics()
+
+
+_LAZY_CONSTANTS = {
+    'DIARRHEA_DURATION': _make_diarrhea_duration,
+    'LRI_DURATION': _make_lri_duration,
+    'LBWSG': _make_lbwsg,
+    'MATERNAL_CHARACTERISTICS': _make_maternal_characteristics,
+}
 
 
-MATERNAL_CHARACTERISTICS = __MaternalCharacteristics()
+def __getattr__(name: str):
+    try:
+        factory = _LAZY_CONSTANTS[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    value = factory()
+    # Cache in module globals so subsequent accesses bypass this hook.
+    globals()[name] = value
+    return value
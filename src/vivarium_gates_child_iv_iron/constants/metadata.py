@@ -1,3 +1,5 @@
+import sys
+
 import pandas as pd
 
 from typing import NamedTuple
@@ -17,14 +19,14 @@ MAKE_ARTIFACT_SLEEP = 10
 
 YEAR_DURATION: float = 365.25
 
-LOCATIONS = [
+LOCATIONS = (
     "Sub-Saharan Africa",
     "South Asia",
     "LMICs",
     "Ethiopia",
     "India",
     "Nigeria",
-]
+)
 
 ARTIFACT_INDEX_COLUMNS = [
     'sex',
@@ -35,7 +37,9 @@ ARTIFACT_INDEX_COLUMNS = [
 ]
 
 DRAW_COUNT = 1000
-ARTIFACT_COLUMNS = pd.Index([f'draw_{i}' for i in range(DRAW_COUNT)])
+# Interned so every frame holding draw columns shares one set of label
+# objects instead of re-allocating a thousand strings per load.
+ARTIFACT_COLUMNS = pd.Index([sys.intern(f'draw_{i}') for i in range(DRAW_COUNT)])
 GBD_2019_ROUND_ID = 6
 
 
@@ -54,16 +58,16 @@ class __AgeGroup(NamedTuple):
     POST_NEONATAL = 4
     YEARS_1_TO_4 = 5
 
-    GBD_2019_LBWSG_EXPOSURE = {BIRTH_ID, EARLY_NEONATAL_ID, LATE_NEONATAL_ID}
-    GBD_2019_LBWSG_RELATIVE_RISK = {EARLY_NEONATAL_ID, LATE_NEONATAL_ID}
-    GBD_2019_SIDS = {LATE_NEONATAL_ID}
+    GBD_2019_LBWSG_EXPOSURE = frozenset({BIRTH_ID, EARLY_NEONATAL_ID, LATE_NEONATAL_ID})
+    GBD_2019_LBWSG_RELATIVE_RISK = frozenset({EARLY_NEONATAL_ID, LATE_NEONATAL_ID})
+    GBD_2019_SIDS = frozenset({LATE_NEONATAL_ID})
 
-    GBD_2019 = {
+    GBD_2019 = frozenset({
         EARLY_NEONATAL_ID,
         LATE_NEONATAL_ID,
         POST_NEONATAL,
         YEARS_1_TO_4,
-    }
+    })
 
 
 AGE_GROUP = __AgeGroup()
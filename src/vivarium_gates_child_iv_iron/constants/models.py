@@ -1,3 +1,4 @@
+import sys
 from typing import List, Tuple
 
 from vivarium_gates_child_iv_iron.constants import data_keys
@@ -5,18 +6,31 @@ from vivarium_gates_child_iv_iron.constants import data_keys
 
 class TransitionString(str):
 
+    __slots__ = ('from_state', 'to_state')
+
     def __new__(cls, value):
         # noinspection PyArgumentList
         obj = str.__new__(cls, value.lower())
-        obj.from_state, obj.to_state = value.split('_TO_')
+        from_state, to_state = value.split('_TO_')
+        obj.from_state = sys.intern(from_state)
+        obj.to_state = sys.intern(to_state)
         return obj
 
 
 # noinspection PyPep8Naming
 class __SISModel:
+
+    __slots__ = (
+        'MODEL_NAME',
+        'SUSCEPTIBLE_STATE_NAME',
+        'STATE_NAME',
+        'STATES',
+        'TRANSITIONS',
+    )
+
     def __init__(self, model_name: str):
-        self.MODEL_NAME = model_name
-        self.SUSCEPTIBLE_STATE_NAME: str = f'susceptible_to_{self.MODEL_NAME}'
+        self.MODEL_NAME = sys.intern(model_name)
+        self.SUSCEPTIBLE_STATE_NAME: str = sys.intern(f'susceptible_to_{self.MODEL_NAME}')
         self.STATE_NAME: str = self.MODEL_NAME
         self.STATES: Tuple[str, ...] = (self.SUSCEPTIBLE_STATE_NAME, self.STATE_NAME)
         self.TRANSITIONS: Tuple[TransitionString, ...] = (
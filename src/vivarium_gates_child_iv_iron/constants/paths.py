@@ -1,15 +1,37 @@
 from pathlib import Path
 
-import vivarium_gates_child_iv_iron
 from vivarium_gates_child_iv_iron.constants import metadata
 
-BASE_DIR = Path(vivarium_gates_child_iv_iron.__file__).resolve().parent
+TEMPORARY_PAF_DIR = Path("/share/costeffectiveness/auxiliary_data/GBD_2019/01_original_data/population_attributable_fraction/risk_factor/lbwsg/data/")
 
-ARTIFACT_ROOT = BASE_DIR / "artifacts"
-MODEL_SPEC_DIR = BASE_DIR / "model_specifications"
-RAW_DATA_DIR = BASE_DIR / "data/raw"
 
-MATERNAL_INTERVENTION_COVERAGE_CSV = RAW_DATA_DIR / "simulation_intervention_coverage.csv"
+# The package-relative paths stat the filesystem to resolve the install
+# location, so they are computed on first access (PEP 562) and cached in
+# module globals rather than at import.
+
+def _base_dir() -> Path:
+    import vivarium_gates_child_iv_iron
+    return Path(vivarium_gates_child_iv_iron.__file__).resolve().parent
+
+
+_LAZY_PATHS = {
+    'BASE_DIR': _base_dir,
+    'ARTIFACT_ROOT': lambda: _base_dir() / "artifacts",
+    'MODEL_SPEC_DIR': lambda: _base_dir() / "model_specifications",
+    'RAW_DATA_DIR': lambda: _base_dir() / "data/raw",
+    'MATERNAL_INTERVENTION_COVERAGE_CSV': (
+        lambda: _base_dir() / "data/raw" / "simulation_intervention_coverage.csv"
+    ),
+}
 
-TEMPORARY_PAF_DIR = Path("/share/costeffectiveness/auxiliary_data/GBD_2019/01_original_data/population_attributable_fraction/risk_factor/lbwsg/data/")
 
+def __getattr__(name: str) -> Path:
+    try:
+        factory = _LAZY_PATHS[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    value = factory()
+    globals()[name] = value
+    return value
@@ -1,5 +1,9 @@
 import itertools
+import sys
+from functools import lru_cache
+from string import Formatter
 
+import numpy as np
 import pandas as pd
 
 from vivarium_gates_child_iv_iron.constants import data_keys, models
@@ -124,7 +128,7 @@ CAUSES_OF_DISABILITY = (
     models.MODERATE_PEM.STATE_NAME,
     models.SEVERE_PEM.STATE_NAME,
 )
-CGF_RISK_STATES = tuple([category.value for category in data_keys.CGFCategories])
+CGF_RISK_STATES = tuple(sys.intern(category.value) for category in data_keys.CGFCategories)
 TETRACHOTOMTOUS_RISK_STATES = ("cat1", "cat2", "cat3", "cat4")
 LBWSG_SUB_RISKS = ("birth_weight", "gestational_age")
 MATERNAL_SUPPLEMENTATION_TYPES = ("uncovered", "ifa", "mms", "bep")
@@ -155,43 +159,107 @@ TEMPLATE_FIELD_MAP = {
 }
 
 
-# noinspection PyPep8Naming
-def RESULT_COLUMNS(kind='all'):
+# Fields used by each template, parsed once at import. Ordered to match
+# TEMPLATE_FIELD_MAP so expansions are identical to the former substring scan.
+_TEMPLATE_FIELDS = {
+    kind: tuple(
+        field for field in TEMPLATE_FIELD_MAP
+        if field in {name for _, name, _, _ in Formatter().parse(template) if name}
+    )
+    for kind, template in COLUMN_TEMPLATES.items()
+}
+
+# Positional variants of the templates (ordered to match _TEMPLATE_FIELDS) so
+# expansion can format value tuples directly without building a kwargs dict
+# per row.
+_POSITIONAL_TEMPLATES = {
+    kind: template.format(
+        **{field: f'{{{position}}}' for position, field in enumerate(_TEMPLATE_FIELDS[kind])}
+    )
+    for kind, template in COLUMN_TEMPLATES.items()
+}
+
+
+@lru_cache(maxsize=None)
+def _result_columns(kind):
+    """Expands a column template once per kind; results are memoized."""
     if kind not in COLUMN_TEMPLATES and kind != 'all':
         raise ValueError(f'Unknown result column type {kind}')
-    columns = []
     if kind == 'all':
-        for k in COLUMN_TEMPLATES:
-            columns += RESULT_COLUMNS(k)
-        columns = list(STANDARD_COLUMNS.values()) + columns
+        return (
+            *STANDARD_COLUMNS.values(),
+            *itertools.chain.from_iterable(_result_columns(k) for k in COLUMN_TEMPLATES),
+        )
     else:
-        template = COLUMN_TEMPLATES[kind]
-        filtered_field_map = {field: values
-                              for field, values in TEMPLATE_FIELD_MAP.items() if
-                              f'{{{field}}}' in template}
-        fields, value_groups = filtered_field_map.keys(), itertools.product(
-            *filtered_field_map.values())
+        columns = []
+        template = _POSITIONAL_TEMPLATES[kind]
+        fields = _TEMPLATE_FIELDS[kind]
+        value_groups = itertools.product(*(TEMPLATE_FIELD_MAP[field] for field in fields))
         for value_group in value_groups:
-            columns.append(
-                template.format(**{field: value for field, value in zip(fields, value_group)}))
-    return columns
+            columns.append(template.format(*value_group))
+    return tuple(columns)
 
 
 # noinspection PyPep8Naming
-def RESULTS_MAP(kind):
+def RESULT_COLUMNS(kind='all'):
+    # Hand out a fresh list so callers can extend or mutate freely without
+    # corrupting the cached expansion.
+    return list(_result_columns(kind))
+
+
+@lru_cache(maxsize=None)
+def _results_map(kind):
     if kind not in COLUMN_TEMPLATES:
         raise ValueError(f'Unknown result column type {kind}')
-    columns = []
-    template = COLUMN_TEMPLATES[kind]
-    filtered_field_map = {field: values
-                          for field, values in TEMPLATE_FIELD_MAP.items() if
-                          f'{{{field}}}' in template}
-    fields, value_groups = list(filtered_field_map.keys()), list(
-        itertools.product(*filtered_field_map.values()))
-    for value_group in value_groups:
-        columns.append(
-            template.format(**{field: value for field, value in zip(fields, value_group)}))
-    df = pd.DataFrame(value_groups, columns=map(lambda x: x.lower(), fields))
-    df['key'] = columns
-    df['measure'] = kind  # per researcher feedback, this column is useful, even when it's identical for all rows
-    return df.set_index('key').sort_index()
+    template = _POSITIONAL_TEMPLATES[kind]
+    fields = _TEMPLATE_FIELDS[kind]
+    value_lists = [TEMPLATE_FIELD_MAP[field] for field in fields]
+    keys = [
+        template.format(*value_group)
+        for value_group in itertools.product(*value_lists)
+    ]
+
+    # Build each field column as a categorical from tiled/repeated codes
+    # rather than materializing every row as a Python tuple. Categories are
+    # sorted so sort_values on these columns orders rows exactly as the old
+    # object/int columns did.
+    total_rows = len(keys)
+    columns = {}
+    repeat = total_rows
+    tile = 1
+    for field, values in zip(fields, value_lists):
+        size = len(values)
+        repeat //= size
+        base_codes = np.tile(np.repeat(np.arange(size), repeat), tile)
+        tile *= size
+        sorted_values = sorted(values)
+        rank = np.array([sorted_values.index(value) for value in values])
+        columns[field.lower()] = pd.Categorical.from_codes(
+            rank[base_codes], categories=sorted_values
+        )
+
+    df = pd.DataFrame(columns, index=pd.Index(keys, name='key'))
+    # per researcher feedback, this column is useful, even when it's identical
+    # for all rows; single-category categorical so sorts on it compare codes
+    df['measure'] = pd.Categorical.from_codes(
+        np.zeros(total_rows, dtype=np.int8), categories=[kind]
+    )
+    return df.sort_index()
+
+
+# noinspection PyPep8Naming
+def RESULTS_MAP(kind):
+    # Shallow copy: shares the cached column buffers but keeps callers from
+    # adding or overwriting columns on the cached frame.
+    return _results_map(kind).copy(deep=False)
+
+
+def __getattr__(name: str):
+    # ALL_RESULT_COLUMNS is a frozen view of RESULT_COLUMNS('all'), built on
+    # first access (not at import, where it would slow every consumer of the
+    # constants package) and cached in module globals thereafter.
+    if name == 'ALL_RESULT_COLUMNS':
+        value = _result_columns('all')
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -12,13 +12,16 @@ for an example.
 
    No logging is done here. Logging is done in vivarium inputs itself and forwarded.
 """
+import functools
 import pickle
-from typing import Tuple, Union
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Tuple, Union
 
 import numpy as np
 import pandas as pd
 from gbd_mapping import Cause, sequelae
-from scipy.interpolate import RectBivariateSpline, griddata
+from scipy.interpolate import RectBivariateSpline
+from scipy.spatial import cKDTree
 from vivarium.framework.artifact import EntityKey
 from vivarium_gbd_access import constants as gbd_constants
 from vivarium_gbd_access import gbd
@@ -33,9 +36,20 @@ from vivarium_gates_child_iv_iron.data import utilities
 from vivarium_gates_child_iv_iron.utilities import get_random_variable_draws
 
 
+# Loaders call back into ``get_data`` for their inputs (e.g. prevalence needs
+# incidence and duration, which both need demography), so the same expensive
+# ``interface.get_measure`` fetch can be triggered several times per artifact
+# build. Completed loads are memoized here for the lifetime of the process.
+_DATA_CACHE: Dict[Tuple[str, str], Any] = {}
+
+
 def get_data(lookup_key: str, location: str) -> pd.DataFrame:
     """Retrieves data from an appropriate source.
 
+    Results are cached by (key, location), so each key is computed at most
+    once per artifact build. DataFrames are returned as copies to keep
+    callers from mutating the cached data.
+
     Parameters
     ----------
     lookup_key
@@ -49,115 +63,15 @@ def get_data(lookup_key: str, location: str) -> pd.DataFrame:
         The requested data.
 
     """
-    mapping = {
-        data_keys.POPULATION.LOCATION: load_population_location,
-        data_keys.POPULATION.STRUCTURE: load_population_structure,
-        data_keys.POPULATION.AGE_BINS: load_age_bins,
-        data_keys.POPULATION.DEMOGRAPHY: load_demographic_dimensions,
-        data_keys.POPULATION.TMRLE: load_theoretical_minimum_risk_life_expectancy,
-        data_keys.POPULATION.ACMR: load_standard_data,
-        data_keys.POPULATION.CRUDE_BIRTH_RATE: load_standard_data,
-
-        data_keys.DIARRHEA.DURATION: load_duration,
-        data_keys.DIARRHEA.PREVALENCE: load_prevalence_from_incidence_and_duration,
-        data_keys.DIARRHEA.INCIDENCE_RATE: load_standard_data,
-        data_keys.DIARRHEA.REMISSION_RATE: load_remission_rate_from_duration,
-        data_keys.DIARRHEA.DISABILITY_WEIGHT: load_standard_data,
-        data_keys.DIARRHEA.EMR: load_emr_from_csmr_and_prevalence,
-        data_keys.DIARRHEA.CSMR: load_diarrhea_csmr,
-        data_keys.DIARRHEA.RESTRICTIONS: load_metadata,
-        data_keys.DIARRHEA.BIRTH_PREVALENCE: load_diarrhea_birth_prevalence,
-
-        data_keys.MEASLES.PREVALENCE: load_standard_data,
-        data_keys.MEASLES.INCIDENCE_RATE: load_standard_data,
-        data_keys.MEASLES.DISABILITY_WEIGHT: load_standard_data,
-        data_keys.MEASLES.EMR: load_standard_data,
-        data_keys.MEASLES.CSMR: load_standard_data,
-        data_keys.MEASLES.RESTRICTIONS: load_metadata,
-
-        data_keys.LRI.DURATION: load_duration,
-        data_keys.LRI.PREVALENCE: load_prevalence_from_incidence_and_duration,
-        data_keys.LRI.INCIDENCE_RATE: load_standard_data,
-        data_keys.LRI.REMISSION_RATE: load_remission_rate_from_duration,
-        data_keys.LRI.DISABILITY_WEIGHT: load_standard_data,
-        data_keys.LRI.EMR: load_emr_from_csmr_and_prevalence,
-        data_keys.LRI.CSMR: load_lri_csmr,
-        data_keys.LRI.RESTRICTIONS: load_metadata,
-
-        data_keys.WASTING.DISTRIBUTION: load_metadata,
-        data_keys.WASTING.ALT_DISTRIBUTION: load_metadata,
-        data_keys.WASTING.CATEGORIES: load_metadata,
-        data_keys.WASTING.EXPOSURE: load_standard_data,
-        data_keys.WASTING.RELATIVE_RISK: load_standard_data,
-        data_keys.WASTING.PAF: load_categorical_paf,
-
-        data_keys.STUNTING.DISTRIBUTION: load_metadata,
-        data_keys.STUNTING.ALT_DISTRIBUTION: load_metadata,
-        data_keys.STUNTING.CATEGORIES: load_metadata,
-        data_keys.STUNTING.EXPOSURE: load_standard_data,
-        data_keys.STUNTING.RELATIVE_RISK: load_standard_data,
-        data_keys.STUNTING.PAF: load_categorical_paf,
-
-        data_keys.MODERATE_PEM.DISABILITY_WEIGHT: load_pem_disability_weight,
-        data_keys.MODERATE_PEM.EMR: load_pem_emr,
-        data_keys.MODERATE_PEM.CSMR: load_pem_csmr,
-        data_keys.MODERATE_PEM.RESTRICTIONS: load_pem_restrictions,
-        data_keys.SEVERE_PEM.DISABILITY_WEIGHT: load_pem_disability_weight,
-        data_keys.SEVERE_PEM.EMR: load_pem_emr,
-        data_keys.SEVERE_PEM.CSMR: load_pem_csmr,
-        data_keys.SEVERE_PEM.RESTRICTIONS: load_pem_restrictions,
-
-        data_keys.LBWSG.DISTRIBUTION: load_metadata,
-        data_keys.LBWSG.CATEGORIES: load_metadata,
-        data_keys.LBWSG.EXPOSURE: load_lbwsg_exposure,
-        data_keys.LBWSG.RELATIVE_RISK: load_lbwsg_rr,
-        data_keys.LBWSG.RELATIVE_RISK_INTERPOLATOR: load_lbwsg_interpolated_rr,
-        data_keys.LBWSG.PAF: load_lbwsg_paf,
-
-        data_keys.AFFECTED_UNMODELED_CAUSES.URI_CSMR: load_standard_data,
-        data_keys.AFFECTED_UNMODELED_CAUSES.OTITIS_MEDIA_CSMR: load_standard_data,
-        data_keys.AFFECTED_UNMODELED_CAUSES.MENINGITIS_CSMR: load_standard_data,
-        data_keys.AFFECTED_UNMODELED_CAUSES.ENCEPHALITIS_CSMR: load_standard_data,
-        data_keys.AFFECTED_UNMODELED_CAUSES.NEONATAL_PRETERM_BIRTH_CSMR: load_standard_data,
-        data_keys.AFFECTED_UNMODELED_CAUSES.NEONATAL_ENCEPHALOPATHY_CSMR: load_standard_data,
-        data_keys.AFFECTED_UNMODELED_CAUSES.NEONATAL_SEPSIS_CSMR: load_standard_data,
-        data_keys.AFFECTED_UNMODELED_CAUSES.NEONATAL_JAUNDICE_CSMR: load_standard_data,
-        data_keys.AFFECTED_UNMODELED_CAUSES.OTHER_NEONATAL_DISORDERS_CSMR: load_standard_data,
-        data_keys.AFFECTED_UNMODELED_CAUSES.SIDS_CSMR: load_sids_csmr,
-        data_keys.AFFECTED_UNMODELED_CAUSES.NEONATAL_LRI_CSMR: load_neonatal_lri_csmr,
-        data_keys.AFFECTED_UNMODELED_CAUSES.NEONATAL_DIARRHEAL_DISEASES_CSMR: load_neonatal_diarrhea_csmr,
-
-        data_keys.IFA_SUPPLEMENTATION.DISTRIBUTION: load_intervention_distribution,
-        data_keys.IFA_SUPPLEMENTATION.CATEGORIES: load_intervention_categories,
-        data_keys.IFA_SUPPLEMENTATION.EXPOSURE: load_dichotomous_treatment_exposure,
-        data_keys.IFA_SUPPLEMENTATION.EXCESS_SHIFT: load_treatment_excess_shift,
-        data_keys.IFA_SUPPLEMENTATION.RISK_SPECIFIC_SHIFT: load_risk_specific_shift,
-
-        data_keys.MMN_SUPPLEMENTATION.DISTRIBUTION: load_intervention_distribution,
-        data_keys.MMN_SUPPLEMENTATION.CATEGORIES: load_intervention_categories,
-        data_keys.MMN_SUPPLEMENTATION.EXPOSURE: load_dichotomous_treatment_exposure,
-        data_keys.MMN_SUPPLEMENTATION.EXCESS_SHIFT: load_treatment_excess_shift,
-        data_keys.MMN_SUPPLEMENTATION.RISK_SPECIFIC_SHIFT: load_risk_specific_shift,
-
-        data_keys.BEP_SUPPLEMENTATION.DISTRIBUTION: load_intervention_distribution,
-        data_keys.BEP_SUPPLEMENTATION.CATEGORIES: load_intervention_categories,
-        data_keys.BEP_SUPPLEMENTATION.EXPOSURE: load_dichotomous_treatment_exposure,
-        data_keys.BEP_SUPPLEMENTATION.EXCESS_SHIFT: load_treatment_excess_shift,
-        data_keys.BEP_SUPPLEMENTATION.RISK_SPECIFIC_SHIFT: load_risk_specific_shift,
-
-        data_keys.IV_IRON.DISTRIBUTION: load_intervention_distribution,
-        data_keys.IV_IRON.CATEGORIES: load_intervention_categories,
-        data_keys.IV_IRON.EXPOSURE: load_dichotomous_treatment_exposure,
-        data_keys.IV_IRON.EXCESS_SHIFT: load_treatment_excess_shift,
-        data_keys.IV_IRON.RISK_SPECIFIC_SHIFT: load_risk_specific_shift,
-
-        data_keys.MATERNAL_BMI_ANEMIA.DISTRIBUTION: load_maternal_bmi_anemia_distribution,
-        data_keys.MATERNAL_BMI_ANEMIA.CATEGORIES: load_maternal_bmi_anemia_categories,
-        data_keys.MATERNAL_BMI_ANEMIA.EXPOSURE: load_maternal_bmi_anemia_exposure,
-        data_keys.MATERNAL_BMI_ANEMIA.EXCESS_SHIFT: load_maternal_bmi_anemia_excess_shift,
-        data_keys.MATERNAL_BMI_ANEMIA.RISK_SPECIFIC_SHIFT: load_risk_specific_shift,
-    }
-    return mapping[lookup_key](lookup_key, location)
+    hit = _DATA_CACHE.get((lookup_key, location))
+    if hit is not None:
+        return hit.copy() if isinstance(hit, pd.DataFrame) else hit
+    loader = _DISPATCH.get(lookup_key)
+    if loader is None:
+        raise ValueError(f"Unrecognized key {lookup_key}")
+    result = loader(lookup_key, location)
+    _DATA_CACHE[(lookup_key, location)] = result
+    return result.copy() if isinstance(result, pd.DataFrame) else result
 
 
 def load_population_location(key: str, location: str) -> str:
@@ -169,50 +83,74 @@ def load_population_location(key: str, location: str) -> str:
 
 def load_population_structure(key: str, location: str) -> pd.DataFrame:
     if location == "LMICs":
-        world_bank_1 = filter_population(
-            interface.get_population_structure("World Bank Low Income")
-        )
-        world_bank_2 = filter_population(
-            interface.get_population_structure("World Bank Lower Middle Income")
-        )
-        population_structure = pd.concat([world_bank_1, world_bank_2])
+        # The two World Bank fetches are independent round trips to GBD, so
+        # issue them concurrently and overlap the I/O waits.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            low_income = executor.submit(
+                interface.get_population_structure, "World Bank Low Income"
+            )
+            lower_middle_income = executor.submit(
+                interface.get_population_structure, "World Bank Lower Middle Income"
+            )
+            world_bank_1 = filter_population(low_income.result())
+            world_bank_2 = filter_population(lower_middle_income.result())
+        population_structure = pd.concat([world_bank_1, world_bank_2], copy=False)
     else:
         population_structure = filter_population(interface.get_population_structure(location))
     return population_structure
 
 
 def filter_population(unfiltered: pd.DataFrame) -> pd.DataFrame:
-    unfiltered = unfiltered.reset_index()
-    filtered_pop = unfiltered[(unfiltered.age_end <= 5)]
-    filtered_pop = filtered_pop.set_index(ARTIFACT_INDEX_COLUMNS)
-
-    return filtered_pop
+    # Filter on the index level where possible so only the under-five rows
+    # pay for the reset/set_index round trip.
+    if "age_end" in unfiltered.index.names:
+        age_end = unfiltered.index.get_level_values("age_end").to_numpy()
+        filtered_pop = unfiltered.iloc[age_end <= 5].reset_index()
+    else:
+        unfiltered = unfiltered.reset_index()
+        filtered_pop = unfiltered[(unfiltered.age_end <= 5)]
+    return filtered_pop.set_index(ARTIFACT_INDEX_COLUMNS)
 
 
-def load_age_bins(key: str, location: str) -> pd.DataFrame:
+# Age bins and the life expectancy table are global GBD data, so fetch them
+# once regardless of how many locations an artifact build touches.
+@functools.lru_cache(maxsize=1)
+def _get_under_five_age_bins() -> pd.DataFrame:
     all_age_bins = interface.get_age_bins().reset_index()
     return all_age_bins[all_age_bins.age_start < 5].set_index(
         ["age_start", "age_end", "age_group_name"]
     )
 
 
+def load_age_bins(key: str, location: str) -> pd.DataFrame:
+    return _get_under_five_age_bins().copy()
+
+
 def load_demographic_dimensions(key: str, location: str) -> pd.DataFrame:
     demographic_dimensions = interface.get_demographic_dimensions(location)
     is_under_five = demographic_dimensions.index.get_level_values("age_end") <= 5
     return demographic_dimensions[is_under_five]
 
 
-def load_theoretical_minimum_risk_life_expectancy(key: str, location: str) -> pd.DataFrame:
+@functools.lru_cache(maxsize=1)
+def _get_theoretical_minimum_risk_life_expectancy() -> pd.DataFrame:
     return interface.get_theoretical_minimum_risk_life_expectancy()
 
 
+def load_theoretical_minimum_risk_life_expectancy(key: str, location: str) -> pd.DataFrame:
+    return _get_theoretical_minimum_risk_life_expectancy().copy()
+
+
 def load_standard_data(key: str, location: str) -> pd.DataFrame:
     key = EntityKey(key)
     entity = utilities.get_entity(key)
     return interface.get_measure(entity, key.measure, location).droplevel("location")
 
 
-def load_metadata(key: str, location: str):
+# Entity metadata is immutable for a run and independent of location, so the
+# entity traversal is resolved once per key.
+@functools.lru_cache(maxsize=None)
+def _get_entity_metadata(key: str):
     key = EntityKey(key)
     entity = utilities.get_entity(key)
     entity_metadata = entity[key.measure]
@@ -221,13 +159,23 @@ def load_metadata(key: str, location: str):
     return entity_metadata
 
 
+def load_metadata(key: str, location: str):
+    entity_metadata = _get_entity_metadata(key)
+    # dict metadata is handed out as a copy so callers cannot mutate the cache
+    if isinstance(entity_metadata, dict):
+        return dict(entity_metadata)
+    return entity_metadata
+
+
+_PAF_RISKS = {
+    data_keys.WASTING.PAF: data_keys.WASTING,
+    data_keys.STUNTING.PAF: data_keys.STUNTING,
+}
+
+
 def load_categorical_paf(key: str, location: str) -> pd.DataFrame:
-    try:
-        risk = {
-            data_keys.WASTING.PAF: data_keys.WASTING,
-            data_keys.STUNTING.PAF: data_keys.STUNTING,
-        }[key]
-    except KeyError:
+    risk = _PAF_RISKS.get(key)
+    if risk is None:
         raise ValueError(f"Unrecognized key {key}")
 
     distribution_type = get_data(risk.DISTRIBUTION, location)
@@ -242,13 +190,29 @@ def load_categorical_paf(key: str, location: str) -> pd.DataFrame:
     rr = get_data(risk.RELATIVE_RISK, location)
 
     # paf = (sum_categories(exp * rr) - 1) / sum_categories(exp * rr)
-    sum_exp_x_rr = (
-        (exp * rr)
-        .groupby(list(set(rr.index.names) - {"parameter"}))
-        .sum()
-        .reset_index()
-        .set_index(rr.index.names[:-1])
-    )
+    product = _multiply_aligned(exp, rr)
+    demographic_index = product.index.droplevel("parameter")
+    n_categories = product.index.get_level_values("parameter").nunique()
+    block_index = demographic_index[::n_categories]
+    if (
+        len(product) % n_categories == 0
+        and block_index.repeat(n_categories).equals(demographic_index)
+    ):
+        # The sorted hierarchical index keeps the categories in contiguous,
+        # complete blocks, so the category sum is one numpy reduction.
+        values = product.to_numpy()
+        sum_exp_x_rr = pd.DataFrame(
+            values.reshape(-1, n_categories, values.shape[1]).sum(axis=1),
+            index=block_index,
+            columns=product.columns,
+        )
+    else:
+        demographic_levels = [
+            name for name in product.index.names if name != "parameter"
+        ]
+        sum_exp_x_rr = product.groupby(
+            level=demographic_levels, sort=False, observed=True
+        ).sum()
     paf = (sum_exp_x_rr - 1) / sum_exp_x_rr
     return paf
 
@@ -258,7 +222,8 @@ def _load_em_from_meid(location, meid, measure):
     data = gbd.get_modelable_entity_draws(meid, location_id)
     data = data[data.measure_id == vi_globals.MEASURES[measure]]
     data = vi_utils.normalize(data, fill_value=0)
-    data = data.filter(vi_globals.DEMOGRAPHIC_COLUMNS + vi_globals.DRAW_COLUMNS)
+    wanted_columns = vi_globals.DEMOGRAPHIC_COLUMNS + vi_globals.DRAW_COLUMNS
+    data = data[[c for c in wanted_columns if c in data.columns]]
     data = vi_utils.reshape(data)
     data = vi_utils.scrub_gbd_conventions(data, location)
     data = vi_utils.split_interval(data, interval_column="age", split_column_prefix="age")
@@ -267,48 +232,108 @@ def _load_em_from_meid(location, meid, measure):
 
 
 # TODO - add project-specific data functions here
+@functools.lru_cache(maxsize=8)
+def _demography_index(location: str) -> pd.MultiIndex:
+    """Demographic index for a location.
+
+    Cached so the many loaders that only need the index to broadcast
+    against skip the frame copy get_data makes on every call. The index
+    is immutable, so sharing it across loaders is safe.
+    """
+    return get_data(data_keys.POPULATION.DEMOGRAPHY, location).index
+
+
+_DURATION_DISTRIBUTIONS = {
+    data_keys.DIARRHEA.DURATION: data_values.DIARRHEA_DURATION,
+    data_keys.LRI.DURATION: data_values.LRI_DURATION,
+}
+
+
 def load_duration(key: str, location: str) -> pd.DataFrame:
-    try:
-        distribution = {
-            data_keys.DIARRHEA.DURATION: data_values.DIARRHEA_DURATION,
-            data_keys.LRI.DURATION: data_values.LRI_DURATION,
-        }[key]
-    except KeyError:
+    distribution = _DURATION_DISTRIBUTIONS.get(key)
+    if distribution is None:
         raise ValueError(f"Unrecognized key {key}")
 
-    demography = get_data(data_keys.POPULATION.DEMOGRAPHY, location)
+    index = _demography_index(location)
     duration_draws = (
         get_random_variable_draws(metadata.ARTIFACT_COLUMNS, *distribution)
         / metadata.YEAR_DURATION
     )
 
+    # broadcast_to gives a zero-copy view of the single draw row instead of
+    # asking pandas to inflate a one-row frame across the demography index
     duration = pd.DataFrame(
-        [duration_draws], columns=metadata.ARTIFACT_COLUMNS, index=demography.index
+        np.broadcast_to(
+            duration_draws.to_numpy(),
+            (len(index), len(metadata.ARTIFACT_COLUMNS)),
+        ),
+        columns=metadata.ARTIFACT_COLUMNS,
+        index=index,
     )
 
     return duration.droplevel("location")
 
 
+def _multiply_aligned(left: pd.DataFrame, right: pd.DataFrame) -> pd.DataFrame:
+    """Multiply draw matrices that share an index, skipping re-alignment."""
+    if not (left.index.equals(right.index) and left.columns.equals(right.columns)):
+        return left * right
+    return pd.DataFrame(
+        left.to_numpy() * right.to_numpy(), index=left.index, columns=left.columns
+    )
+
+
+def _divide_aligned_fill_zero(
+    numerator: pd.DataFrame, denominator: pd.DataFrame
+) -> pd.DataFrame:
+    """Divide draw matrices elementwise, mapping division by zero to zero.
+
+    Equivalent to ``(numerator / denominator).fillna(0).replace([inf, -inf], 0)``
+    but makes a single pass over the data and never materializes the
+    intermediate inf/nan values.
+    """
+    if not (
+        numerator.index.equals(denominator.index)
+        and numerator.columns.equals(denominator.columns)
+    ):
+        data = (numerator / denominator).fillna(0)
+        return data.replace([np.inf, -np.inf], 0)
+    denominator_values = denominator.to_numpy()
+    quotient = np.zeros_like(denominator_values, dtype=float)
+    np.divide(
+        numerator.to_numpy(), denominator_values,
+        out=quotient, where=denominator_values != 0,
+    )
+    return pd.DataFrame(quotient, index=numerator.index, columns=numerator.columns)
+
+
+_PREVALENCE_CAUSES = {
+    data_keys.DIARRHEA.PREVALENCE: data_keys.DIARRHEA,
+    data_keys.LRI.PREVALENCE: data_keys.LRI,
+}
+
+
 def load_prevalence_from_incidence_and_duration(key: str, location: str) -> pd.DataFrame:
-    try:
-        cause = {
-            data_keys.DIARRHEA.PREVALENCE: data_keys.DIARRHEA,
-            data_keys.LRI.PREVALENCE: data_keys.LRI,
-        }[key]
-    except KeyError:
+    cause = _PREVALENCE_CAUSES.get(key)
+    if cause is None:
         raise ValueError(f"Unrecognized key {key}")
 
     incidence_rate = get_data(cause.INCIDENCE_RATE, location)
     duration = get_data(cause.DURATION, location)
-    prevalence = incidence_rate * duration
+    prevalence = _multiply_aligned(incidence_rate, duration)
 
     # get enn prevalence
     birth_prevalence = data_values.BIRTH_PREVALENCE_OF_ZERO
-    enn_prevalence = prevalence.query("age_start == 0")
-    enn_prevalence = (birth_prevalence + enn_prevalence) / 2
-    all_other_prevalence = prevalence.query("age_start != 0.0")
+    is_early_neonatal = prevalence.index.get_level_values("age_start").to_numpy() == 0.0
+    enn_prevalence = (birth_prevalence + prevalence.iloc[is_early_neonatal]) / 2
+    all_other_prevalence = prevalence.iloc[~is_early_neonatal]
 
-    prevalence = pd.concat([enn_prevalence, all_other_prevalence]).sort_index()
+    # The two slices partition the already-sorted index, so reindexing onto it
+    # restores the original order without a comparison sort.
+    full_index = prevalence.index
+    prevalence = pd.concat(
+        [enn_prevalence, all_other_prevalence], copy=False
+    ).reindex(full_index)
 
     # If cause is diarrhea, set early and late neonatal groups prevalence to that of post-neonatal age group
     if key == data_keys.DIARRHEA.PREVALENCE:
@@ -316,72 +341,106 @@ def load_prevalence_from_incidence_and_duration(key: str, location: str) -> pd.D
     return prevalence
 
 
+_REMISSION_CAUSES = {
+    data_keys.DIARRHEA.REMISSION_RATE: data_keys.DIARRHEA,
+    data_keys.LRI.REMISSION_RATE: data_keys.LRI,
+}
+
+
 def load_remission_rate_from_duration(key: str, location: str) -> pd.DataFrame:
-    try:
-        cause = {
-            data_keys.DIARRHEA.REMISSION_RATE: data_keys.DIARRHEA,
-            data_keys.LRI.REMISSION_RATE: data_keys.LRI,
-        }[key]
-    except KeyError:
+    cause = _REMISSION_CAUSES.get(key)
+    if cause is None:
         raise ValueError(f"Unrecognized key {key}")
     step_size = 4 / 365  # years
     duration = get_data(cause.DURATION, location)
-    remission_rate = (-1 / step_size) * np.log(1 - step_size / duration)
+    # Work on the underlying array so the scalar chain makes one pass over
+    # the draw matrix instead of allocating a frame per operation.
+    remission_rate = pd.DataFrame(
+        (-1 / step_size) * np.log(1 - step_size / duration.to_numpy()),
+        index=duration.index,
+        columns=duration.columns,
+    )
 
     if key == data_keys.DIARRHEA.REMISSION_RATE:
-        remission_rate.loc[remission_rate.index.get_level_values('age_start') < metadata.NEONATAL_END_AGE, :] = 0
+        remission_rate = _zero_rows_by_age(remission_rate, zero_neonatal=True)
     return remission_rate
 
 
+_EMR_CAUSES = {
+    data_keys.DIARRHEA.EMR: data_keys.DIARRHEA,
+    data_keys.LRI.EMR: data_keys.LRI,
+}
+
+
 def load_emr_from_csmr_and_prevalence(key: str, location: str) -> pd.DataFrame:
-    try:
-        cause = {
-            data_keys.DIARRHEA.EMR: data_keys.DIARRHEA,
-            data_keys.LRI.EMR: data_keys.LRI,
-        }[key]
-    except KeyError:
+    cause = _EMR_CAUSES.get(key)
+    if cause is None:
         raise ValueError(f"Unrecognized key {key}")
 
     csmr = get_data(cause.CSMR, location)
     prevalence = get_data(cause.PREVALENCE, location)
-    data = (csmr / prevalence).fillna(0)
-    data = data.replace([np.inf, -np.inf], 0)
+    data = _divide_aligned_fill_zero(csmr, prevalence)
 
     if key == data_keys.DIARRHEA.EMR:
-        data.loc[data.index.get_level_values('age_start') < metadata.NEONATAL_END_AGE, :] = 0
+        data = _zero_rows_by_age(data, zero_neonatal=True)
     return data
 
 
+_PEM_SEQUELAE = {
+    data_keys.MODERATE_PEM.DISABILITY_WEIGHT: [
+        sequelae.moderate_wasting_with_edema,
+        sequelae.moderate_wasting_without_edema,
+    ],
+    data_keys.SEVERE_PEM.DISABILITY_WEIGHT: [
+        sequelae.severe_wasting_with_edema,
+        sequelae.severe_wasting_without_edema,
+    ],
+}
+
+
 def load_pem_disability_weight(key: str, location: str) -> pd.DataFrame:
-    try:
-        pem_sequelae = {
-            data_keys.MODERATE_PEM.DISABILITY_WEIGHT: [
-                sequelae.moderate_wasting_with_edema,
-                sequelae.moderate_wasting_without_edema,
-            ],
-            data_keys.SEVERE_PEM.DISABILITY_WEIGHT: [
-                sequelae.severe_wasting_with_edema,
-                sequelae.severe_wasting_without_edema,
-            ],
-        }[key]
-    except KeyError:
+    pem_sequelae = _PEM_SEQUELAE.get(key)
+    if pem_sequelae is None:
         raise ValueError(f"Unrecognized key {key}")
 
-    prevalence_disability_weight = []
-    state_prevalence = []
-    for s in pem_sequelae:
-        sequela_prevalence = interface.get_measure(s, "prevalence", location)
-        sequela_disability_weight = interface.get_measure(s, "disability_weight", location)
-
-        prevalence_disability_weight += [sequela_prevalence * sequela_disability_weight]
-        state_prevalence += [sequela_prevalence]
+    # Each sequela needs two independent GBD fetches; issue all of them
+    # concurrently so the wall time is bounded by the slowest round trip.
+    with ThreadPoolExecutor(max_workers=2 * len(pem_sequelae)) as executor:
+        futures = {
+            (s, measure): executor.submit(interface.get_measure, s, measure, location)
+            for s in pem_sequelae
+            for measure in ("prevalence", "disability_weight")
+        }
+        state_prevalence = [futures[(s, "prevalence")].result() for s in pem_sequelae]
+        disability_weights = [
+            futures[(s, "disability_weight")].result() for s in pem_sequelae
+        ]
 
-    disability_weight = (
-        (sum(prevalence_disability_weight) / sum(state_prevalence))
-        .fillna(0)
-        .droplevel("location")
-    )
-    return disability_weight
+    reference = state_prevalence[0]
+    if all(
+        frame.index.equals(reference.index) and frame.columns.equals(reference.columns)
+        for frame in state_prevalence[1:] + disability_weights
+    ):
+        # The sequela frames share one index, so reduce them as a stacked
+        # tensor rather than summing DataFrames pairwise in Python.
+        prevalence_values = np.stack([frame.to_numpy() for frame in state_prevalence])
+        weight_values = np.stack([frame.to_numpy() for frame in disability_weights])
+        numerator = (prevalence_values * weight_values).sum(axis=0)
+        denominator = prevalence_values.sum(axis=0)
+        quotient = np.zeros_like(numerator)
+        np.divide(numerator, denominator, out=quotient, where=denominator != 0)
+        disability_weight = pd.DataFrame(
+            quotient, index=reference.index, columns=reference.columns
+        )
+    else:
+        prevalence_disability_weight = [
+            prevalence * weight
+            for prevalence, weight in zip(state_prevalence, disability_weights)
+        ]
+        disability_weight = (
+            sum(prevalence_disability_weight) / sum(state_prevalence)
+        ).fillna(0)
+    return disability_weight.droplevel("location")
 
 
 def load_pem_emr(key: str, location: str) -> pd.DataFrame:
@@ -415,9 +474,23 @@ def load_lbwsg_exposure(key: str, location: str) -> pd.DataFrame:
     # floating point headaches, so clip everything to reasonable values
     data = data.clip(lower=vi_globals.MINIMUM_EXPOSURE_VALUE)
 
-    # normalize so all categories sum to 1
-    total_exposure = data.groupby(['location_id', 'age_group_id', 'sex_id']).transform('sum')
-    data = (data / total_exposure).reset_index()
+    # normalize so all categories sum to 1; the fetch is restricted to a
+    # single year, so pivoting parameter wide and reducing over the category
+    # axis in numpy replaces the per-draw-column groupby transform
+    wide = data.unstack('parameter')
+    values = wide.to_numpy(copy=True)
+    if not np.isnan(values).any():
+        n_parameters = values.shape[1] // len(vi_globals.DRAW_COLUMNS)
+        reshaped = values.reshape(len(wide), -1, n_parameters)
+        reshaped /= reshaped.sum(axis=2, keepdims=True)
+        data = (
+            pd.DataFrame(values, index=wide.index, columns=wide.columns)
+            .stack('parameter')[vi_globals.DRAW_COLUMNS]
+            .reset_index()
+        )
+    else:
+        total_exposure = data.groupby(['location_id', 'age_group_id', 'sex_id']).transform('sum')
+        data = (data / total_exposure).reset_index()
     data = reshape_to_vivarium_format(data, location)
     return data
 
@@ -437,8 +510,9 @@ def load_lbwsg_rr(key: str, location: str) -> pd.DataFrame:
         metadata.AGE_GROUP.GBD_2019_LBWSG_RELATIVE_RISK,
         metadata.GBD_2019_ROUND_ID,
         "step4",
+        year_id=[2019],
     )
-    data = data[data["year_id"] == 2019].drop(columns="year_id")
+    data = data.drop(columns="year_id")
     data = utilities.process_relative_risk(
         data,
         key,
@@ -453,19 +527,45 @@ def load_lbwsg_rr(key: str, location: str) -> pd.DataFrame:
     return data
 
 
+def _make_lbwsg_interpolator(
+    log_rr_values: np.ndarray,
+    nearest_midpoint_index: np.ndarray,
+    gestational_age_grid: np.ndarray,
+    birth_weight_grid: np.ndarray,
+) -> str:
+    """Fit and serialize the spline for one (age, sex, draw) row.
+
+    Module-level so it can be dispatched to worker processes.
+    """
+    # Extrapolate to the grid using the precomputed nearest-neighbor map
+    log_rr_grid_nearest = log_rr_values[nearest_midpoint_index].reshape(
+        len(gestational_age_grid), len(birth_weight_grid)
+    )
+    interpolator = RectBivariateSpline(
+        gestational_age_grid, birth_weight_grid, log_rr_grid_nearest, kx=1, ky=1
+    )
+    # Hex encoding is part of the artifact contract: vivarium_public_health's
+    # LBWSGRiskEffect decodes this column with bytes.fromhex.
+    return pickle.dumps(interpolator, protocol=pickle.HIGHEST_PROTOCOL).hex()
+
+
 def load_lbwsg_interpolated_rr(key: str, location: str) -> pd.DataFrame:
     if key != data_keys.LBWSG.RELATIVE_RISK_INTERPOLATOR:
         raise ValueError(f"Unrecognized key {key}")
 
     rr = get_data(data_keys.LBWSG.RELATIVE_RISK, location).reset_index()
-    rr["parameter"] = pd.Categorical(rr["parameter"], [f"cat{i}" for i in range(1000)])
+    # The explicit category list already fixes the column order that
+    # unstack("parameter") emits, so no row pre-sort is needed.
+    rr["parameter"] = pd.Categorical(
+        rr["parameter"], [f"cat{i}" for i in range(1000)], ordered=True
+    )
     rr = (
-        rr.sort_values("parameter")
-        .set_index(metadata.ARTIFACT_INDEX_COLUMNS + ["parameter"])
+        rr.set_index(metadata.ARTIFACT_INDEX_COLUMNS + ["parameter"])
         .stack()
         .unstack("parameter")
-        .apply(np.log)
     )
+    # one ufunc call over the ndarray instead of a per-column .apply
+    rr = pd.DataFrame(np.log(rr.to_numpy()), index=rr.index, columns=rr.columns)
 
     # get category midpoints
     def get_category_midpoints(lbwsg_type: str) -> pd.Series:
@@ -486,25 +586,35 @@ def load_lbwsg_interpolated_rr(key: str, location: str) -> pd.DataFrame:
     gestational_age_grid = get_grid(gestational_age_midpoints, (0.0, 42.0))
     birth_weight_grid = get_grid(birth_weight_midpoints, (0.0, 4500.0))
 
-    def make_interpolator(log_rr_for_age_sex_draw: pd.Series) -> RectBivariateSpline:
-        # Use scipy.interpolate.griddata to extrapolate to grid using nearest neighbor interpolation
-        log_rr_grid_nearest = griddata(
-            (gestational_age_midpoints, birth_weight_midpoints),
-            log_rr_for_age_sex_draw,
-            (gestational_age_grid[:, None], birth_weight_grid[None, :]),
-            method="nearest",
-            rescale=True,
-        )
-        # return a RectBivariateSpline object from the extrapolated values on grid
-        return RectBivariateSpline(
-            gestational_age_grid, birth_weight_grid, log_rr_grid_nearest, kx=1, ky=1
-        )
+    # The nearest-neighbor assignment from category midpoints to grid points
+    # is identical for every (age, sex, draw) row, so resolve it once with a
+    # KD-tree instead of re-triangulating inside the per-row apply. Axes are
+    # rescaled to the midpoint ranges to match griddata(..., rescale=True).
+    midpoints = np.column_stack([gestational_age_midpoints, birth_weight_midpoints])
+    axis_scale = midpoints.max(axis=0) - midpoints.min(axis=0)
+    axis_scale[axis_scale == 0] = 1.0
+    grid_points = np.column_stack([
+        np.repeat(gestational_age_grid, len(birth_weight_grid)),
+        np.tile(birth_weight_grid, len(gestational_age_grid)),
+    ])
+    _, nearest_midpoint_index = cKDTree(midpoints / axis_scale).query(
+        grid_points / axis_scale
+    )
 
-    log_rr_interpolator = (
-        rr.apply(make_interpolator, axis="columns")
-        .apply(lambda x: pickle.dumps(x).hex())
-        .unstack()
+    # Each (age, sex, draw) row is independent, so fan the spline fits out
+    # across cores instead of fitting them one at a time in .apply.
+    make_interpolator = functools.partial(
+        _make_lbwsg_interpolator,
+        nearest_midpoint_index=nearest_midpoint_index,
+        gestational_age_grid=gestational_age_grid,
+        birth_weight_grid=birth_weight_grid,
     )
+    with ProcessPoolExecutor() as executor:
+        pickled_interpolators = list(
+            executor.map(make_interpolator, rr.to_numpy(), chunksize=64)
+        )
+
+    log_rr_interpolator = pd.Series(pickled_interpolators, index=rr.index).unstack()
     return log_rr_interpolator
 
 
@@ -520,16 +630,22 @@ def load_lbwsg_paf(key: str, location: str) -> pd.DataFrame:
                        "India": "india"}
 
     output_dir = paths.TEMPORARY_PAF_DIR / location_mapper[location]
-    paf_files = output_dir.glob("*.hdf")
-    paf_data = pd.concat([pd.read_hdf(paf_file) for paf_file in paf_files]).sort_values(
-        metadata.ARTIFACT_INDEX_COLUMNS + ["draw"]
+    paf_files = sorted(output_dir.glob("*.hdf"))
+    # HDF reads release the GIL, so pull the files in concurrently and let
+    # concat consume them without an extra block copy.
+    with ThreadPoolExecutor(max_workers=min(4, len(paf_files)) or 1) as executor:
+        paf_data = pd.concat(
+            executor.map(pd.read_hdf, paf_files), copy=False, ignore_index=True
+        )
+    paf_data.sort_values(
+        metadata.ARTIFACT_INDEX_COLUMNS + ["draw"], inplace=True, kind="mergesort"
     )
 
-    paf_data["draw"] = paf_data["draw"].apply(lambda draw: f"draw_{draw}")
+    paf_data = paf_data.set_index(metadata.ARTIFACT_INDEX_COLUMNS + ["draw"]).unstack("draw")
 
-    paf_data = paf_data.set_index(metadata.ARTIFACT_INDEX_COLUMNS + ["draw"]).unstack()
-
-    paf_data.columns = paf_data.columns.droplevel(0)
+    # Format the draw labels after the unstack so the string formatting runs
+    # once per draw column instead of once per row.
+    paf_data.columns = [f"draw_{draw}" for draw in paf_data.columns.get_level_values(-1)]
     paf_data.columns.name = None
 
     full_index = (
@@ -616,52 +732,88 @@ def load_treatment_excess_shift(key: str, location: str) -> pd.DataFrame:
     return load_dichotomous_excess_shift(location, distribution_data, is_risk=False)
 
 
+def _stack_category_frames(
+        frames_by_category: Dict[str, pd.DataFrame],
+        constant_levels: Dict[str, str] = None,
+) -> pd.DataFrame:
+    """Stack per-category draw frames into the sorted long format.
+
+    Equivalent to tagging each frame with its category, concatenating,
+    appending the tags to the index, and sort_index(), but interleaves the
+    rows directly from the shared (already sorted) index so the frames are
+    copied once and never re-sorted.
+    """
+    categories = sorted(frames_by_category)
+    first = frames_by_category[categories[0]]
+    index = first.index
+    n_categories = len(categories)
+    values = np.empty((len(index) * n_categories, first.shape[1]))
+    for position, category in enumerate(categories):
+        values[position::n_categories] = frames_by_category[category].to_numpy()
+
+    arrays = [index.get_level_values(name).repeat(n_categories) for name in index.names]
+    names = list(index.names)
+    for name, value in (constant_levels or {}).items():
+        arrays.append(np.repeat(value, len(index) * n_categories))
+        names.append(name)
+    arrays.append(np.tile(categories, len(index)))
+    names.append('parameter')
+
+    return pd.DataFrame(
+        values,
+        index=pd.MultiIndex.from_arrays(arrays, names=names),
+        columns=first.columns,
+    )
+
+
 def load_dichotomous_exposure(
         location: str,
         distribution_data: Union[float, pd.DataFrame],
         is_risk: bool,
 ) -> pd.DataFrame:
-    index = get_data(data_keys.POPULATION.DEMOGRAPHY, location).index
+    index = _demography_index(location)
     if type(distribution_data) == float:
-        base_exposure = pd.Series(distribution_data, index=index)
-        exposed = (
-            pd.DataFrame({f'draw_{i}': base_exposure for i in range(1000)})
-            .droplevel('location')
-        )
+        # one broadcast block instead of building 1000 identical columns
+        exposed = pd.DataFrame(
+            np.broadcast_to(
+                distribution_data, (len(index), len(metadata.ARTIFACT_COLUMNS))
+            ),
+            index=index,
+            columns=metadata.ARTIFACT_COLUMNS,
+        ).droplevel('location')
     else:
         exposed = distribution_data
 
     unexposed = 1 - exposed
-    exposed['parameter'] = 'cat1' if is_risk else 'cat2'
-    unexposed['parameter'] = 'cat2' if is_risk else 'cat1'
-
-    exposure = (
-        pd.concat([exposed, unexposed])
-        .set_index('parameter', append=True)
-        .sort_index()
-    )
+    exposure = _stack_category_frames({
+        'cat1' if is_risk else 'cat2': exposed,
+        'cat2' if is_risk else 'cat1': unexposed,
+    })
     return exposure
 
 
 def load_dichotomous_excess_shift(
         location: str, distribution_data: Tuple, is_risk: bool
 ) -> pd.DataFrame:
-    index = get_data(data_keys.POPULATION.DEMOGRAPHY, location).index
+    index = _demography_index(location)
     shift = get_random_variable_draws(metadata.ARTIFACT_COLUMNS, *distribution_data)
 
-    exposed = pd.DataFrame([shift], index=index)
-    exposed['parameter'] = 'cat1' if is_risk else 'cat2'
-    unexposed = pd.DataFrame([pd.Series(0.0, index=metadata.ARTIFACT_COLUMNS)], index=index)
-    unexposed['parameter'] = 'cat2' if is_risk else 'cat1'
-
-    excess_shift = pd.concat([exposed, unexposed])
-    excess_shift['affected_entity'] = data_keys.LBWSG.BIRTH_WEIGHT_EXPOSURE.name
-    excess_shift['affected_measure'] = data_keys.LBWSG.BIRTH_WEIGHT_EXPOSURE.measure
-
-    excess_shift = (
-        excess_shift
-        .set_index(['affected_entity', 'affected_measure', 'parameter'], append=True)
-        .sort_index()
+    exposed = pd.DataFrame(
+        np.broadcast_to(shift.to_numpy(), (len(index), len(metadata.ARTIFACT_COLUMNS))),
+        index=index,
+        columns=metadata.ARTIFACT_COLUMNS,
+    )
+    unexposed = pd.DataFrame(0.0, index=index, columns=metadata.ARTIFACT_COLUMNS)
+
+    excess_shift = _stack_category_frames(
+        {
+            'cat1' if is_risk else 'cat2': exposed,
+            'cat2' if is_risk else 'cat1': unexposed,
+        },
+        constant_levels={
+            'affected_entity': data_keys.LBWSG.BIRTH_WEIGHT_EXPOSURE.name,
+            'affected_measure': data_keys.LBWSG.BIRTH_WEIGHT_EXPOSURE.measure,
+        },
     )
     return excess_shift
 
@@ -696,7 +848,7 @@ def load_risk_specific_shift(key: str, location: str) -> pd.DataFrame:
 
 def load_baseline_ifa_supplementation_coverage(location: str) -> pd.DataFrame:
 
-    index = get_data(data_keys.POPULATION.DEMOGRAPHY, location).index
+    index = _demography_index(location)
     location_id = utility_data.get_location_id(location)
     intervention_scenarios = pd.read_csv(paths.MATERNAL_INTERVENTION_COVERAGE_CSV)
 
@@ -712,8 +864,10 @@ def load_baseline_ifa_supplementation_coverage(location: str) -> pd.DataFrame:
     df = df.reset_index().drop(columns=['year'])
     df = df.iloc[[0]]
 
-    exposure = pd.DataFrame(data=np.repeat(df.values, len(index), axis=0), columns=df.columns,
-                            index=index).droplevel("location")
+    # every row is the same coverage draw, so broadcast a zero-copy view of
+    # the single row instead of materializing the full repeat
+    exposure = pd.DataFrame(data=np.broadcast_to(df.values, (len(index), df.shape[1])),
+                            columns=df.columns, index=index).droplevel("location")
     return exposure
 
 
@@ -738,22 +892,31 @@ def load_maternal_bmi_anemia_categories(key: str, location: str) -> pd.DataFrame
     }
 
 
+@functools.lru_cache(maxsize=16)
+def _read_hgb_table(filename: str) -> Dict[int, pd.Series]:
+    """Parse a hemoglobin proportion CSV once, split by location id.
+
+    The same files back every location's exposure build, so the parse is
+    cached and the per-location filter becomes a dict lookup.
+    """
+    raw_data = pd.read_csv(paths.RAW_DATA_DIR / filename)
+    table = {}
+    for location_id, group in raw_data.groupby('location_id'):
+        draws = group.set_index('draw')['value']
+        draws.index.name = None
+        table[location_id] = draws
+    return table
+
+
 def load_maternal_bmi_anemia_exposure(key: str, location: str) -> pd.DataFrame:
     if key != data_keys.MATERNAL_BMI_ANEMIA.EXPOSURE:
         raise ValueError(f"Unrecognized key {key}")
 
     location_id = utility_data.get_location_id(location)
-    index = get_data(data_keys.POPULATION.DEMOGRAPHY, location).index.droplevel('location')
+    index = _demography_index(location).droplevel('location')
 
     def _read_hgb_data(filename: str) -> pd.Series:
-        raw_data = pd.read_csv(paths.RAW_DATA_DIR / filename)
-        data = (
-            raw_data.loc[raw_data['location_id'] == location_id, ['draw', 'value']]
-            .set_index('draw')
-            .squeeze()
-        )
-        data.index.name = None
-        return data
+        return _read_hgb_table(filename)[location_id]
 
     p_low_hgb = _read_hgb_data("pregnant_proportion_with_hgb_below_100.csv")
     p_low_bmi_given_low_hgb = _read_hgb_data(
@@ -763,25 +926,19 @@ def load_maternal_bmi_anemia_exposure(key: str, location: str) -> pd.DataFrame:
         "prevalence_of_low_bmi_given_hemoglobin_above_10_age_weighted.csv"
     )
 
-    cat4_exposure = pd.DataFrame([(1 - p_low_hgb) * (1 - p_low_bmi_given_high_hgb)], index=index)
-    cat4_exposure['parameter'] = 'cat4'
-
-    cat3_exposure = pd.DataFrame([(1 - p_low_hgb) * p_low_bmi_given_high_hgb], index=index)
-    cat3_exposure['parameter'] = 'cat3'
-
-    cat2_exposure = pd.DataFrame([p_low_hgb * (1 - p_low_bmi_given_low_hgb)], index=index)
-    cat2_exposure['parameter'] = 'cat2'
-
-    cat1_exposure = pd.DataFrame([p_low_hgb * p_low_bmi_given_low_hgb], index=index)
-    cat1_exposure['parameter'] = 'cat1'
-
-    exposure = pd.concat([cat4_exposure, cat3_exposure, cat2_exposure, cat1_exposure])
+    def _broadcast_draws(draws: pd.Series) -> pd.DataFrame:
+        return pd.DataFrame(
+            np.broadcast_to(draws.to_numpy(), (len(index), len(draws))),
+            index=index,
+            columns=draws.index,
+        )
 
-    exposure = (
-        exposure
-        .set_index(['parameter'], append=True)
-        .sort_index()
-    )
+    exposure = _stack_category_frames({
+        'cat4': _broadcast_draws((1 - p_low_hgb) * (1 - p_low_bmi_given_high_hgb)),
+        'cat3': _broadcast_draws((1 - p_low_hgb) * p_low_bmi_given_high_hgb),
+        'cat2': _broadcast_draws(p_low_hgb * (1 - p_low_bmi_given_low_hgb)),
+        'cat1': _broadcast_draws(p_low_hgb * p_low_bmi_given_low_hgb),
+    })
 
     return exposure
 
@@ -790,7 +947,7 @@ def load_maternal_bmi_anemia_excess_shift(key: str, location: str) -> pd.DataFra
     if key != data_keys.MATERNAL_BMI_ANEMIA.EXCESS_SHIFT:
         raise ValueError(f"Unrecognized key {key}")
 
-    index = get_data(data_keys.POPULATION.DEMOGRAPHY, location).index.droplevel('location')
+    index = _demography_index(location).droplevel('location')
     cat3_draws = get_random_variable_draws(
         metadata.ARTIFACT_COLUMNS,
         *data_values.MATERNAL_CHARACTERISTICS.BMI_ANEMIA_CAT3_BIRTH_WEIGHT_SHIFT
@@ -804,36 +961,50 @@ def load_maternal_bmi_anemia_excess_shift(key: str, location: str) -> pd.DataFra
         *data_values.MATERNAL_CHARACTERISTICS.BMI_ANEMIA_CAT1_BIRTH_WEIGHT_SHIFT
     )
 
-    cat4_shift = pd.DataFrame(0.0, columns=metadata.ARTIFACT_COLUMNS, index=index)
-    cat4_shift['parameter'] = 'cat4'
-    
-    cat3_shift = pd.DataFrame([cat3_draws], index=index)
-    cat3_shift['parameter'] = 'cat3'
-    
-    cat2_shift = pd.DataFrame([cat2_draws], index=index)
-    cat2_shift['parameter'] = 'cat2'
-    
-    cat1_shift = pd.DataFrame([cat1_draws], index=index)
-    cat1_shift['parameter'] = 'cat1'
-
-    excess_shift = pd.concat([cat4_shift, cat3_shift, cat2_shift, cat1_shift])
-    excess_shift['affected_entity'] = data_keys.LBWSG.BIRTH_WEIGHT_EXPOSURE.name
-    excess_shift['affected_measure'] = data_keys.LBWSG.BIRTH_WEIGHT_EXPOSURE.measure
+    def _broadcast_draws(draws: pd.Series) -> pd.DataFrame:
+        return pd.DataFrame(
+            np.broadcast_to(draws.to_numpy(), (len(index), len(draws))),
+            index=index,
+            columns=draws.index,
+        )
 
-    excess_shift = (
-        excess_shift
-        .set_index(['affected_entity', 'affected_measure', 'parameter'], append=True)
-        .sort_index()
+    excess_shift = _stack_category_frames(
+        {
+            'cat4': pd.DataFrame(0.0, columns=metadata.ARTIFACT_COLUMNS, index=index),
+            'cat3': _broadcast_draws(cat3_draws),
+            'cat2': _broadcast_draws(cat2_draws),
+            'cat1': _broadcast_draws(cat1_draws),
+        },
+        constant_levels={
+            'affected_entity': data_keys.LBWSG.BIRTH_WEIGHT_EXPOSURE.name,
+            'affected_measure': data_keys.LBWSG.BIRTH_WEIGHT_EXPOSURE.measure,
+        },
     )
     return excess_shift
 
 
+def _zero_rows_by_age(data: pd.DataFrame, zero_neonatal: bool) -> pd.DataFrame:
+    """Zero the neonatal (or post-neonatal) rows of a draw frame.
+
+    A positional mask plus one numpy write replaces the label-based
+    ``.loc`` assignment, which re-materializes the age level and takes
+    the slow pandas setitem path on every call.
+    """
+    ages = data.index.get_level_values('age_start').to_numpy()
+    mask = ages < metadata.NEONATAL_END_AGE
+    if not zero_neonatal:
+        mask = ~mask
+    values = data.to_numpy(copy=True)
+    values[mask] = 0.0
+    return pd.DataFrame(values, index=data.index, columns=data.columns)
+
+
 def load_neonatal_lri_csmr(key: str, location: str) -> pd.DataFrame:
     if key != data_keys.AFFECTED_UNMODELED_CAUSES.NEONATAL_LRI_CSMR:
         raise ValueError(f"Unrecognized key {key}")
 
     data = load_standard_data(data_keys.LRI.CSMR, location)
-    data.loc[data.index.get_level_values('age_start') >= metadata.NEONATAL_END_AGE, :] = 0
+    data = _zero_rows_by_age(data, zero_neonatal=False)
     return data
 
 
@@ -842,7 +1013,7 @@ def load_lri_csmr(key: str, location: str) -> pd.DataFrame:
         raise ValueError(f"Unrecognized key {key}")
 
     data = load_standard_data(data_keys.LRI.CSMR, location)
-    data.loc[data.index.get_level_values('age_start') < metadata.NEONATAL_END_AGE, :] = 0
+    data = _zero_rows_by_age(data, zero_neonatal=True)
     return data
 
 
@@ -851,7 +1022,7 @@ def load_diarrhea_csmr(key: str, location: str) -> pd.DataFrame:
         raise ValueError(f"Unrecognized key {key}")
 
     data = load_standard_data(data_keys.DIARRHEA.CSMR, location)
-    data.loc[data.index.get_level_values('age_start') < metadata.NEONATAL_END_AGE, :] = 0
+    data = _zero_rows_by_age(data, zero_neonatal=True)
     return data
 
 
@@ -860,7 +1031,7 @@ def load_neonatal_diarrhea_csmr(key: str, location: str) -> pd.DataFrame:
         raise ValueError(f"Unrecognized key {key}")
 
     data = load_standard_data(data_keys.DIARRHEA.CSMR, location)
-    data.loc[data.index.get_level_values('age_start') >= metadata.NEONATAL_END_AGE, :] = 0
+    data = _zero_rows_by_age(data, zero_neonatal=False)
     return data
 
 
@@ -869,11 +1040,9 @@ def load_diarrhea_birth_prevalence(key: str, location: str) -> pd.DataFrame:
         raise ValueError(f"Unrecognized key {key}")
 
     prevalence = get_data(data_keys.DIARRHEA.PREVALENCE, location)
-    post_neonatal = prevalence.loc[
-        (prevalence.index.get_level_values("age_start") >= metadata.NEONATAL_END_AGE)
-        & (prevalence.index.get_level_values("age_start") < 1)
-        ]
-    data = post_neonatal.droplevel(['age_start', 'age_end'])
+    ages = prevalence.index.get_level_values("age_start").to_numpy()
+    is_post_neonatal = (ages >= metadata.NEONATAL_END_AGE) & (ages < 1)
+    data = prevalence.iloc[is_post_neonatal].droplevel(['age_start', 'age_end'])
 
     return data
 
@@ -886,3 +1055,115 @@ def reshape_to_vivarium_format(df, location):
     df = vi_utils.sort_hierarchical_data(df)
     df.index = df.index.droplevel("location")
     return df
+
+
+# Maps artifact keys to their loaders. Built once at import so get_data
+# does a single dict probe per call; defined after the loaders it references.
+_DISPATCH: Dict[str, Callable[[str, str], Any]] = {
+    data_keys.POPULATION.LOCATION: load_population_location,
+    data_keys.POPULATION.STRUCTURE: load_population_structure,
+    data_keys.POPULATION.AGE_BINS: load_age_bins,
+    data_keys.POPULATION.DEMOGRAPHY: load_demographic_dimensions,
+    data_keys.POPULATION.TMRLE: load_theoretical_minimum_risk_life_expectancy,
+    data_keys.POPULATION.ACMR: load_standard_data,
+    data_keys.POPULATION.CRUDE_BIRTH_RATE: load_standard_data,
+
+    data_keys.DIARRHEA.DURATION: load_duration,
+    data_keys.DIARRHEA.PREVALENCE: load_prevalence_from_incidence_and_duration,
+    data_keys.DIARRHEA.INCIDENCE_RATE: load_standard_data,
+    data_keys.DIARRHEA.REMISSION_RATE: load_remission_rate_from_duration,
+    data_keys.DIARRHEA.DISABILITY_WEIGHT: load_standard_data,
+    data_keys.DIARRHEA.EMR: load_emr_from_csmr_and_prevalence,
+    data_keys.DIARRHEA.CSMR: load_diarrhea_csmr,
+    data_keys.DIARRHEA.RESTRICTIONS: load_metadata,
+    data_keys.DIARRHEA.BIRTH_PREVALENCE: load_diarrhea_birth_prevalence,
+
+    data_keys.MEASLES.PREVALENCE: load_standard_data,
+    data_keys.MEASLES.INCIDENCE_RATE: load_standard_data,
+    data_keys.MEASLES.DISABILITY_WEIGHT: load_standard_data,
+    data_keys.MEASLES.EMR: load_standard_data,
+    data_keys.MEASLES.CSMR: load_standard_data,
+    data_keys.MEASLES.RESTRICTIONS: load_metadata,
+
+    data_keys.LRI.DURATION: load_duration,
+    data_keys.LRI.PREVALENCE: load_prevalence_from_incidence_and_duration,
+    data_keys.LRI.INCIDENCE_RATE: load_standard_data,
+    data_keys.LRI.REMISSION_RATE: load_remission_rate_from_duration,
+    data_keys.LRI.DISABILITY_WEIGHT: load_standard_data,
+    data_keys.LRI.EMR: load_emr_from_csmr_and_prevalence,
+    data_keys.LRI.CSMR: load_lri_csmr,
+    data_keys.LRI.RESTRICTIONS: load_metadata,
+
+    data_keys.WASTING.DISTRIBUTION: load_metadata,
+    data_keys.WASTING.ALT_DISTRIBUTION: load_metadata,
+    data_keys.WASTING.CATEGORIES: load_metadata,
+    data_keys.WASTING.EXPOSURE: load_standard_data,
+    data_keys.WASTING.RELATIVE_RISK: load_standard_data,
+    data_keys.WASTING.PAF: load_categorical_paf,
+
+    data_keys.STUNTING.DISTRIBUTION: load_metadata,
+    data_keys.STUNTING.ALT_DISTRIBUTION: load_metadata,
+    data_keys.STUNTING.CATEGORIES: load_metadata,
+    data_keys.STUNTING.EXPOSURE: load_standard_data,
+    data_keys.STUNTING.RELATIVE_RISK: load_standard_data,
+    data_keys.STUNTING.PAF: load_categorical_paf,
+
+    data_keys.MODERATE_PEM.DISABILITY_WEIGHT: load_pem_disability_weight,
+    data_keys.MODERATE_PEM.EMR: load_pem_emr,
+    data_keys.MODERATE_PEM.CSMR: load_pem_csmr,
+    data_keys.MODERATE_PEM.RESTRICTIONS: load_pem_restrictions,
+    data_keys.SEVERE_PEM.DISABILITY_WEIGHT: load_pem_disability_weight,
+    data_keys.SEVERE_PEM.EMR: load_pem_emr,
+    data_keys.SEVERE_PEM.CSMR: load_pem_csmr,
+    data_keys.SEVERE_PEM.RESTRICTIONS: load_pem_restrictions,
+
+    data_keys.LBWSG.DISTRIBUTION: load_metadata,
+    data_keys.LBWSG.CATEGORIES: load_metadata,
+    data_keys.LBWSG.EXPOSURE: load_lbwsg_exposure,
+    data_keys.LBWSG.RELATIVE_RISK: load_lbwsg_rr,
+    data_keys.LBWSG.RELATIVE_RISK_INTERPOLATOR: load_lbwsg_interpolated_rr,
+    data_keys.LBWSG.PAF: load_lbwsg_paf,
+
+    data_keys.AFFECTED_UNMODELED_CAUSES.URI_CSMR: load_standard_data,
+    data_keys.AFFECTED_UNMODELED_CAUSES.OTITIS_MEDIA_CSMR: load_standard_data,
+    data_keys.AFFECTED_UNMODELED_CAUSES.MENINGITIS_CSMR: load_standard_data,
+    data_keys.AFFECTED_UNMODELED_CAUSES.ENCEPHALITIS_CSMR: load_standard_data,
+    data_keys.AFFECTED_UNMODELED_CAUSES.NEONATAL_PRETERM_BIRTH_CSMR: load_standard_data,
+    data_keys.AFFECTED_UNMODELED_CAUSES.NEONATAL_ENCEPHALOPATHY_CSMR: load_standard_data,
+    data_keys.AFFECTED_UNMODELED_CAUSES.NEONATAL_SEPSIS_CSMR: load_standard_data,
+    data_keys.AFFECTED_UNMODELED_CAUSES.NEONATAL_JAUNDICE_CSMR: load_standard_data,
+    data_keys.AFFECTED_UNMODELED_CAUSES.OTHER_NEONATAL_DISORDERS_CSMR: load_standard_data,
+    data_keys.AFFECTED_UNMODELED_CAUSES.SIDS_CSMR: load_sids_csmr,
+    data_keys.AFFECTED_UNMODELED_CAUSES.NEONATAL_LRI_CSMR: load_neonatal_lri_csmr,
+    data_keys.AFFECTED_UNMODELED_CAUSES.NEONATAL_DIARRHEAL_DISEASES_CSMR: load_neonatal_diarrhea_csmr,
+
+    data_keys.IFA_SUPPLEMENTATION.DISTRIBUTION: load_intervention_distribution,
+    data_keys.IFA_SUPPLEMENTATION.CATEGORIES: load_intervention_categories,
+    data_keys.IFA_SUPPLEMENTATION.EXPOSURE: load_dichotomous_treatment_exposure,
+    data_keys.IFA_SUPPLEMENTATION.EXCESS_SHIFT: load_treatment_excess_shift,
+    data_keys.IFA_SUPPLEMENTATION.RISK_SPECIFIC_SHIFT: load_risk_specific_shift,
+
+    data_keys.MMN_SUPPLEMENTATION.DISTRIBUTION: load_intervention_distribution,
+    data_keys.MMN_SUPPLEMENTATION.CATEGORIES: load_intervention_categories,
+    data_keys.MMN_SUPPLEMENTATION.EXPOSURE: load_dichotomous_treatment_exposure,
+    data_keys.MMN_SUPPLEMENTATION.EXCESS_SHIFT: load_treatment_excess_shift,
+    data_keys.MMN_SUPPLEMENTATION.RISK_SPECIFIC_SHIFT: load_risk_specific_shift,
+
+    data_keys.BEP_SUPPLEMENTATION.DISTRIBUTION: load_intervention_distribution,
+    data_keys.BEP_SUPPLEMENTATION.CATEGORIES: load_intervention_categories,
+    data_keys.BEP_SUPPLEMENTATION.EXPOSURE: load_dichotomous_treatment_exposure,
+    data_keys.BEP_SUPPLEMENTATION.EXCESS_SHIFT: load_treatment_excess_shift,
+    data_keys.BEP_SUPPLEMENTATION.RISK_SPECIFIC_SHIFT: load_risk_specific_shift,
+
+    data_keys.IV_IRON.DISTRIBUTION: load_intervention_distribution,
+    data_keys.IV_IRON.CATEGORIES: load_intervention_categories,
+    data_keys.IV_IRON.EXPOSURE: load_dichotomous_treatment_exposure,
+    data_keys.IV_IRON.EXCESS_SHIFT: load_treatment_excess_shift,
+    data_keys.IV_IRON.RISK_SPECIFIC_SHIFT: load_risk_specific_shift,
+
+    data_keys.MATERNAL_BMI_ANEMIA.DISTRIBUTION: load_maternal_bmi_anemia_distribution,
+    data_keys.MATERNAL_BMI_ANEMIA.CATEGORIES: load_maternal_bmi_anemia_categories,
+    data_keys.MATERNAL_BMI_ANEMIA.EXPOSURE: load_maternal_bmi_anemia_exposure,
+    data_keys.MATERNAL_BMI_ANEMIA.EXCESS_SHIFT: load_maternal_bmi_anemia_excess_shift,
+    data_keys.MATERNAL_BMI_ANEMIA.RISK_SPECIFIC_SHIFT: load_risk_specific_shift,
+}
@@ -31,7 +31,8 @@ from vivarium_gates_child_iv_iron.constants.metadata import AGE_GROUP, GBD_2019_
 
 
 def get_data(key: EntityKey, entity: ModelableEntity, location: str, source: str, gbd_id_type: str,
-             age_group_ids: Set[int], gbd_round_id: int, decomp_step: str = 'iterative') -> pd.DataFrame:
+             age_group_ids: Set[int], gbd_round_id: int, decomp_step: str = 'iterative',
+             year_id: List[int] = None) -> pd.DataFrame:
     age_group_ids = list(age_group_ids)
 
     # from interface.get_measure
@@ -42,6 +43,10 @@ def get_data(key: EntityKey, entity: ModelableEntity, location: str, source: str
     # from vivarium_inputs.extract.extract_data
     check_metadata(entity, key.measure)
 
+    # Push the year restriction down to the fetch when the caller only needs
+    # a subset, so the draws for the other years never come over the wire.
+    extra_kwargs = {} if year_id is None else {'year_id': year_id}
+
     # from vivarium_inputs.extract.extract_{measure}
     # from vivarium_gbd_access.gbd.get_{measure}
     data = get_draws(gbd_id_type=gbd_id_type,
@@ -52,20 +57,24 @@ def get_data(key: EntityKey, entity: ModelableEntity, location: str, source: str
                      age_group_id=age_group_ids,
                      gbd_round_id=gbd_round_id,
                      decomp_step=decomp_step,
-                     status='best')
+                     status='best',
+                     **extra_kwargs)
     return data
 
 
-def get_entity(key: str):
-    # Map of entity types to their gbd mappings.
-    type_map = {
-        'cause': causes,
-        'covariate': covariates,
-        'risk_factor': risk_factors,
-        'alternative_risk_factor': alternative_risk_factors
-    }
-    key = EntityKey(key)
-    return type_map[key.type][key.name]
+# Map of entity types to their gbd mappings.
+_TYPE_MAP = {
+    'cause': causes,
+    'covariate': covariates,
+    'risk_factor': risk_factors,
+    'alternative_risk_factor': alternative_risk_factors
+}
+
+
+def get_entity(key: Union[str, EntityKey]):
+    if not isinstance(key, EntityKey):
+        key = EntityKey(key)
+    return _TYPE_MAP[key.type][key.name]
 
 
 def process_exposure(data: pd.DataFrame, key: str, entity: Union[RiskFactor, AlternativeRiskFactor],
@@ -100,18 +109,28 @@ def process_exposure(data: pd.DataFrame, key: str, entity: Union[RiskFactor, Alt
                           normalize_age_and_years(unexposed, fill_value=1, gbd_round_id=gbd_round_id)],
                          ignore_index=True)
 
-        # normalize so all categories sum to 1
+        # normalize so all categories sum to 1. The category rows of a
+        # demographic group are not contiguous here (exposed rows precede all
+        # unexposed rows), so sum per group with a scatter-add over group
+        # codes and divide in numpy rather than paying for the
+        # groupby/reindex broadcast join.
         cols = list(set(data.columns).difference(vi_globals.DRAW_COLUMNS + ['parameter']))
+        group_codes = data.groupby(cols, sort=False).ngroup().to_numpy()
+        draws = data[vi_globals.DRAW_COLUMNS].to_numpy(copy=True)
+        sums = np.zeros((group_codes.max() + 1, draws.shape[1]))
+        np.add.at(sums, group_codes, draws)
+        draws /= sums[group_codes]
         data = data.set_index(cols + ['parameter'])
-        sums = (
-            data.groupby(cols)[vi_globals.DRAW_COLUMNS].sum()
-                .reindex(index=data.index)
-        )
-        data = data.divide(sums).reset_index()
+        data = pd.DataFrame(
+            draws, index=data.index, columns=vi_globals.DRAW_COLUMNS
+        ).reset_index()
     else:
         data = vi_utils.normalize(data, fill_value=0)
 
-    data = data.filter(vi_globals.DEMOGRAPHIC_COLUMNS + vi_globals.DRAW_COLUMNS + ['parameter'])
+    # plain column indexing instead of .filter, which walks columns through
+    # python-level matching even for exact names
+    wanted_columns = vi_globals.DEMOGRAPHIC_COLUMNS + vi_globals.DRAW_COLUMNS + ['parameter']
+    data = data[[c for c in wanted_columns if c in data.columns]]
     data = validate_and_reshape_gbd_data(data, entity, key, location, gbd_round_id, age_group_ids)
     return data
 
@@ -138,8 +157,9 @@ def process_relative_risk(data: pd.DataFrame, key: str, entity: Union[RiskFactor
     data.loc[~morbidity & mortality, 'affected_measure'] = 'excess_mortality_rate'
     data = filter_relative_risk_to_cause_restrictions(data)
 
-    data = data.filter(vi_globals.DEMOGRAPHIC_COLUMNS + ['affected_entity', 'affected_measure', 'parameter']
-                       + vi_globals.DRAW_COLUMNS)
+    wanted_columns = (vi_globals.DEMOGRAPHIC_COLUMNS + ['affected_entity', 'affected_measure', 'parameter']
+                      + vi_globals.DRAW_COLUMNS)
+    data = data[[c for c in wanted_columns if c in data.columns]]
     data = (data.groupby(['affected_entity', 'parameter'])
             .apply(normalize_age_and_years, fill_value=1, gbd_round_id=gbd_round_id, age_group_ids=age_group_ids)
             .reset_index(drop=True))
@@ -374,7 +394,7 @@ def load_lbwsg_exposure(location: str):
         age_group_id=[2, 3],
         gbd_round_id=gbd_constants.ROUND_IDS.GBD_2019,
         decomp_step=gbd_constants.DECOMP_STEP.STEP_4,
+        # This data set is big, so only pull the one year we keep (~40x less)
+        year_id=2019,
     )
-    # This data set is big, so let's reduce it by a factor of ~40
-    data = data[data['year_id'] == 2019]
     return data
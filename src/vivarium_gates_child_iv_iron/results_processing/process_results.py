@@ -1,5 +1,7 @@
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, NamedTuple, List, Union
+from typing import Dict, NamedTuple, List, Tuple, Union
 
 import pandas as pd
 from loguru import logger
@@ -97,18 +99,53 @@ class MeasureData(NamedTuple):
     live_births_count: pd.DataFrame
     low_weight_births_count: pd.DataFrame
 
-    def dump(self, output_dir: Path):
-        for key, df in self._asdict().items():
-            df.to_hdf(output_dir / f'{key}.hdf', key=key)
-            df.to_csv(output_dir / f'{key}.csv')
+    def dump(self, output_dir: Path, write_csv: bool = True):
+        def _dump_measure(item):
+            key, df = item
+            # table format is required to serialize the categorical
+            # stratification columns; fixed format rejects them. The long
+            # frames compress well, and indexing the group keys as data
+            # columns lets consumers push draw/scenario predicates into
+            # the read.
+            df.to_hdf(
+                output_dir / f'{key}.hdf',
+                key=key,
+                format='table',
+                complib='blosc:lz4',
+                complevel=5,
+                data_columns=[c for c in GROUPBY_COLUMNS if c in df.columns],
+            )
+            if write_csv:
+                df.to_csv(output_dir / f'{key}.csv')
+
+        # PyTables I/O and the C csv writer both release the GIL, so the
+        # 18 independent measure writes overlap well in threads.
+        with ThreadPoolExecutor(max_workers=min(8, len(self._fields))) as executor:
+            list(executor.map(_dump_measure, self._asdict().items()))
+
+
+def _read_output_hdf(path: Path) -> pd.DataFrame:
+    """Load the raw output frame without its throwaway columns.
+
+    Table-format stores support column projection, so the throwaway
+    columns are dropped at the HDF layer and never read off disk or
+    allocated. Fixed-format stores fall back to a full read and drop.
+    """
+    with pd.HDFStore(path, mode='r') as store:
+        key = store.keys()[0]
+        storer = store.get_storer(key)
+        if getattr(storer, 'format_type', None) == 'table':
+            stored_columns = storer.non_index_axes[0][1]
+            throwaway = set(results.THROWAWAY_COLUMNS)
+            return store.select(key, columns=[c for c in stored_columns if c not in throwaway])
+    data = pd.read_hdf(path)
+    # noinspection PyUnresolvedReferences
+    return data.drop(columns=data.columns.intersection(results.THROWAWAY_COLUMNS))
 
 
 def read_data(path: Path, single_run: bool) -> (pd.DataFrame, List[str]):
-    data = pd.read_hdf(path)
-    # noinspection PyUnresolvedReferences
     data = (
-        data
-        .drop(columns=data.columns.intersection(results.THROWAWAY_COLUMNS))
+        _read_output_hdf(path)
         .reset_index(drop=True)
         .rename(
             columns={
@@ -128,37 +165,64 @@ def read_data(path: Path, single_run: bool) -> (pd.DataFrame, List[str]):
             results.OUTPUT_SCENARIO_COLUMN: [scenarios.INTERVENTION_SCENARIOS.BASELINE.name]
         }
     else:
-        data[results.INPUT_DRAW_COLUMN] = data[results.INPUT_DRAW_COLUMN].astype(int)
-        data[results.RANDOM_SEED_COLUMN] = data[results.RANDOM_SEED_COLUMN].astype(int)
+        # int32 is plenty for draw and seed numbers and halves their memory
+        data[results.INPUT_DRAW_COLUMN] = data[results.INPUT_DRAW_COLUMN].astype('int32')
+        data[results.RANDOM_SEED_COLUMN] = data[results.RANDOM_SEED_COLUMN].astype('int32')
         with (path.parent / 'keyspace.yaml').open() as f:
             keyspace = yaml.full_load(f)
+    # The scenario column is a handful of distinct strings repeated over every
+    # row; as a categorical the groupbys and isin filters downstream hash int
+    # codes instead of python strings.
+    data[SCENARIO_COLUMN] = data[SCENARIO_COLUMN].astype('category')
     return data, keyspace
 
 
 def filter_out_incomplete(data: pd.DataFrame, keyspace: Dict[str, Union[str, int]]) -> pd.DataFrame:
-    output = []
-    for draw in keyspace[results.INPUT_DRAW_COLUMN]:
-        # For each draw, gather all random seeds completed for all scenarios.
-        random_seeds = set(keyspace[results.RANDOM_SEED_COLUMN])
-        draw_data = data.loc[data[results.INPUT_DRAW_COLUMN] == draw]
-        for scenario in keyspace[results.OUTPUT_SCENARIO_COLUMN]:
-            seeds_in_data = draw_data.loc[
-                data[SCENARIO_COLUMN] == scenario, results.RANDOM_SEED_COLUMN
-            ].unique()
-            random_seeds = random_seeds.intersection(seeds_in_data)
-        draw_data = draw_data.loc[draw_data[results.RANDOM_SEED_COLUMN].isin(random_seeds)]
-        output.append(draw_data)
-    return pd.concat(output, ignore_index=True).reset_index(drop=True)
+    # A (draw, seed) pair is complete when it shows up for every scenario in
+    # the keyspace. One groupby over the in-keyspace rows finds the complete
+    # pairs; one isin pass keeps their rows. This replaces the per-draw,
+    # per-scenario python loop of slice/unique/intersect/concat operations
+    # with two scans of the frame.
+    scenarios = keyspace[results.OUTPUT_SCENARIO_COLUMN]
+    in_keyspace = (
+        data[results.INPUT_DRAW_COLUMN].isin(keyspace[results.INPUT_DRAW_COLUMN])
+        & data[results.RANDOM_SEED_COLUMN].isin(keyspace[results.RANDOM_SEED_COLUMN])
+        & data[SCENARIO_COLUMN].isin(scenarios)
+    )
+    scenario_counts = (
+        data.loc[in_keyspace]
+        .groupby([results.INPUT_DRAW_COLUMN, results.RANDOM_SEED_COLUMN])[SCENARIO_COLUMN]
+        .nunique()
+    )
+    complete = scenario_counts.index[scenario_counts == len(set(scenarios))]
+    keep = pd.MultiIndex.from_arrays(
+        [data[results.INPUT_DRAW_COLUMN], data[results.RANDOM_SEED_COLUMN]]
+    ).isin(complete)
+    return data.loc[keep].reset_index(drop=True)
 
 
-def aggregate_over_seed(data: pd.DataFrame) -> pd.DataFrame:
-    non_count_columns = []
+@functools.lru_cache(maxsize=None)
+def _count_columns(columns: Tuple[str, ...]) -> List[str]:
+    """Classify result columns once per column layout.
+
+    Expanding the non-count templates is pure python work over thousands
+    of column names, so it is memoized on the frame's column tuple.
+    """
+    non_count_columns = set(GROUPBY_COLUMNS)
     for non_count_template in results.NON_COUNT_TEMPLATES:
-        non_count_columns += results.RESULT_COLUMNS(non_count_template)
-    count_columns = [c for c in data.columns if c not in non_count_columns + GROUPBY_COLUMNS]
+        non_count_columns.update(results.RESULT_COLUMNS(non_count_template))
+    return [c for c in columns if c not in non_count_columns]
+
+
+def aggregate_over_seed(data: pd.DataFrame) -> pd.DataFrame:
+    count_columns = _count_columns(tuple(data.columns))
 
     # non_count_data = data[non_count_columns + GROUPBY_COLUMNS].groupby(GROUPBY_COLUMNS).mean()
-    count_data = data[count_columns + GROUPBY_COLUMNS].groupby(GROUPBY_COLUMNS).sum()
+    count_data = (
+        data[count_columns + GROUPBY_COLUMNS]
+        .groupby(GROUPBY_COLUMNS, sort=False, observed=True)
+        .sum()
+    )
     return pd.concat([
         count_data,
         # non_count_data
@@ -170,13 +234,9 @@ def pivot_data(data: pd.DataFrame, disaggregate_seeds: bool) -> pd.DataFrame:
         groupby_cols = GROUPBY_COLUMNS + [results.RANDOM_SEED_COLUMN]
     else:
         groupby_cols = GROUPBY_COLUMNS
-    return (
-        data
-        .set_index(groupby_cols)
-        .stack()
-        .reset_index()
-        .rename(columns={f'level_{len(groupby_cols)}': 'key', 0: 'value'})
-    )
+    # melt produces the same long frame as set_index/stack/reset_index in one
+    # C-level reshape, without building the intermediate MultiIndex.
+    return data.melt(id_vars=groupby_cols, var_name='key', value_name='value')
 
 
 def sort_data(data: pd.DataFrame, disaggregate_seeds: bool) -> pd.DataFrame:
@@ -190,14 +250,6 @@ def sort_data(data: pd.DataFrame, disaggregate_seeds: bool) -> pd.DataFrame:
     return data.reset_index(drop=True)
 
 
-def apply_results_map(data: pd.DataFrame, kind: str) -> pd.DataFrame:
-    logger.info(f"Mapping {kind} data to stratifications.")
-    map_df = results.RESULTS_MAP(kind)
-    data = data.set_index('key')
-    data = data.join(map_df).reset_index(drop=True)
-    data = data.rename(columns=RENAME_COLUMNS)
-    logger.info(f"Mapping {kind} complete.")
-    return data
 
 
 def get_population_data(data: pd.DataFrame, disaggregate_seeds: bool) -> pd.DataFrame:
@@ -210,33 +262,42 @@ def get_population_data(data: pd.DataFrame, disaggregate_seeds: bool) -> pd.Data
                                 + results.RESULT_COLUMNS('population')
                                 + groupby_cols], disaggregate_seeds)
     total_pop = total_pop.rename(columns={'key': 'measure'})
+    # categorical codes sort like the raw strings (categories default to
+    # sorted order) but compare as ints instead of python strings
+    total_pop['measure'] = total_pop['measure'].astype('category')
     return sort_data(total_pop, disaggregate_seeds)
 
 
 def get_measure_data(data: pd.DataFrame, measure: str, disaggregate_seeds: bool) -> pd.DataFrame:
+    # One fused pass: melt to long form, attach the stratification columns
+    # with a single merge on the melted key, and sort once. The old
+    # pivot/apply_results_map/sort_data chain re-indexed and copied the long
+    # frame at every stage.
     if disaggregate_seeds:
-        data = pivot_data(
-            data[results.RESULT_COLUMNS(measure) + GROUPBY_COLUMNS + [results.RANDOM_SEED_COLUMN]],
-            disaggregate_seeds
-        )
+        groupby_cols = GROUPBY_COLUMNS + [results.RANDOM_SEED_COLUMN]
     else:
-        data = pivot_data(data[results.RESULT_COLUMNS(measure) + GROUPBY_COLUMNS], disaggregate_seeds)
-    data = apply_results_map(data, measure)
+        groupby_cols = GROUPBY_COLUMNS
+    logger.info(f"Mapping {measure} data to stratifications.")
+    data = (
+        data[results.RESULT_COLUMNS(measure) + groupby_cols]
+        .melt(id_vars=groupby_cols, var_name='key', value_name='value')
+        .merge(results.RESULTS_MAP(measure), how='left', left_on='key', right_index=True)
+        .drop(columns='key')
+        .rename(columns=RENAME_COLUMNS)
+    )
+    logger.info(f"Mapping {measure} complete.")
     return sort_data(data, disaggregate_seeds)
 
 
 def get_by_cause_measure_data(data: pd.DataFrame, measure: str, disaggregate_seeds: bool) -> pd.DataFrame:
-    data = get_measure_data(data, measure, disaggregate_seeds)
-    return sort_data(data, disaggregate_seeds)
+    return get_measure_data(data, measure, disaggregate_seeds)
 
 
 def get_state_person_time_measure_data(data: pd.DataFrame, measure: str, disaggregate_seeds: bool) -> pd.DataFrame:
-    data = get_measure_data(data, measure, disaggregate_seeds)
-    return sort_data(data, disaggregate_seeds)
+    return get_measure_data(data, measure, disaggregate_seeds)
 
 
 def get_transition_count_measure_data(data: pd.DataFrame, measure: str, disaggregate_seeds: bool) -> pd.DataFrame:
     # Oops, edge case.
     data = data.drop(columns=[c for c in data.columns if 'event_count' in c and str(results.YEARS[-1]+1) in c])
-    data = get_measure_data(data, measure, disaggregate_seeds)
-    return sort_data(data, disaggregate_seeds)
+    return get_measure_data(data, measure, disaggregate_seeds)
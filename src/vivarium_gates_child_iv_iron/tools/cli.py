@@ -12,7 +12,7 @@ from vivarium_gates_child_iv_iron.tools import build_artifacts, build_results, c
 @click.option('-l', '--location',
               default='all',
               show_default=True,
-              type=click.Choice(metadata.LOCATIONS + ['all']),
+              type=click.Choice(list(metadata.LOCATIONS) + ['all']),
               help=('Location for which to make an artifact. Note: prefer building archives on the cluster.\n'
                     'If you specify location "all" you must be on a cluster node.'))
 @click.option('-o', '--output-dir',
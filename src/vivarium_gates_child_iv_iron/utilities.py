@@ -3,6 +3,7 @@ import numpy as np
 import pandas as pd
 from scipy import stats
 
+from functools import lru_cache
 from typing import List, Tuple, Union
 from pathlib import Path
 from loguru import logger
@@ -59,6 +60,13 @@ def delete_if_exists(*paths: Union[Path, List[Path]], confirm=False):
             p.unlink()
 
 
+@lru_cache(maxsize=None)
+def _get_stdnorm_quantiles(quantiles: Tuple[float, float]) -> np.ndarray:
+    # Every distribution helper needs the standard normal quantiles for the
+    # same handful of rank pairs; evaluate each pair once.
+    return stats.norm.ppf(quantiles)
+
+
 def get_norm(
         mean: float,
         sd: float = None,
@@ -97,7 +105,7 @@ def _get_standard_deviation(
                 "quantile values."
             )
 
-        stdnorm_quantiles = stats.norm.ppf((0.025, 0.975))
+        stdnorm_quantiles = _get_stdnorm_quantiles((0.025, 0.975))
         sd = (upper - lower) / (stdnorm_quantiles[1] - stdnorm_quantiles[0])
     return sd
 
@@ -126,7 +134,7 @@ def get_lognorm_from_quantiles(median: float, lower: float, upper: float,
     # mean (and median) of the normal random variable Y = log(X)
     mu = np.log(median)
     # quantiles of the standard normal distribution corresponding to quantile_ranks
-    stdnorm_quantiles = stats.norm.ppf(quantiles)
+    stdnorm_quantiles = _get_stdnorm_quantiles(quantiles)
     # quantiles of Y = log(X) corresponding to the quantiles (lower, upper) for X
     norm_quantiles = np.log([lower, upper])
     # standard deviation of Y = log(X) computed from the above quantiles for Y
@@ -149,7 +157,7 @@ def get_random_variable(draw: int, seed: str, distribution) -> pd.Series:
 def get_truncnorm_from_quantiles(mean: float, lower: float, upper: float,
                                  quantiles: Tuple[float, float] = (0.025, 0.975),
                                  lower_clip: float = 0.0, upper_clip: float = 1.0) -> stats.truncnorm:
-    stdnorm_quantiles = stats.norm.ppf(quantiles)
+    stdnorm_quantiles = _get_stdnorm_quantiles(quantiles)
     sd = (upper - lower) / (stdnorm_quantiles[1] - stdnorm_quantiles[0])
     a = (lower_clip - mean) / sd if sd else 0.0
     b = (upper_clip - mean) / sd if sd else 0.0
@@ -158,6 +166,6 @@ def get_truncnorm_from_quantiles(mean: float, lower: float, upper: float,
 
 def get_norm_from_quantiles(mean: float, lower: float, upper: float,
                             quantiles: Tuple[float, float] = (0.025, 0.975)) -> stats.norm:
-    stdnorm_quantiles = stats.norm.ppf(quantiles)
+    stdnorm_quantiles = _get_stdnorm_quantiles(quantiles)
     sd = (upper - lower) / (stdnorm_quantiles[1] - stdnorm_quantiles[0])
     return stats.norm(loc=mean, scale=sd)